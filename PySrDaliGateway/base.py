@@ -6,6 +6,11 @@ from typing import Any, Callable, Dict
 from .types import CallbackEventType, ListenerCallback
 
 
+def create_property(dpid: int, data_type: str, value: Any) -> Dict[str, Any]:
+    """Create a property dict for DALI protocol commands."""
+    return {"dpid": dpid, "dataType": data_type, "value": value}
+
+
 class DaliObjectBase(ABC):
     """Abstract base class for DALI objects (Device, Scene, etc.).
 
@@ -20,10 +25,8 @@ class DaliObjectBase(ABC):
     unique_id: str
     gw_sn: str
 
-    @staticmethod
-    def _create_property(dpid: int, data_type: str, value: Any) -> Dict[str, Any]:
-        """Create a property dict for DALI protocol commands."""
-        return {"dpid": dpid, "dataType": data_type, "value": value}
+    # Kept for subclasses; internal call sites use create_property directly
+    _create_property = staticmethod(create_property)
 
     def register_listener(
         self,
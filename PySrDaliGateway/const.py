@@ -15,8 +15,12 @@ DPID_COLOR_TEMP = 23  # Color temperature in Kelvin
 DPID_HSV_COLOR = 24  # HSV color as hex string
 DPID_ENERGY = 30  # Energy consumption value
 
-# Base device model mappings
-_BASE_DEVICE_MODEL_MAP: dict[str, str] = {
+# DPID_HSV_COLOR value: hue (0-360), saturation and value (0-1000) as 4-digit hex
+HSV_HEX_FORMAT = "%04x%04x%04x"
+
+# --- Generated by script/gen_const.py, do not edit by hand ---
+# Includes motion sensor variants 020101-020120
+DEVICE_MODEL_MAP: dict[str, str] = {
     "0101": "DALI DT6 Dimmable Driver",
     "0102": "DALI DT8 Tc Dimmable Driver",
     "0103": "DALI DT8 RGB Dimmable Driver",
@@ -29,15 +33,30 @@ _BASE_DEVICE_MODEL_MAP: dict[str, str] = {
     "0304": "DALI-2 4-Key Push Button Panel",
     "0306": "DALI-2 6-Key Push Button Panel",
     "0308": "DALI-2 8-Key Push Button Panel",
+    "020101": "DALI-2 Motion Sensor",
+    "020102": "DALI-2 Motion Sensor",
+    "020103": "DALI-2 Motion Sensor",
+    "020104": "DALI-2 Motion Sensor",
+    "020105": "DALI-2 Motion Sensor",
+    "020106": "DALI-2 Motion Sensor",
+    "020107": "DALI-2 Motion Sensor",
+    "020108": "DALI-2 Motion Sensor",
+    "020109": "DALI-2 Motion Sensor",
+    "020110": "DALI-2 Motion Sensor",
+    "020111": "DALI-2 Motion Sensor",
+    "020112": "DALI-2 Motion Sensor",
+    "020113": "DALI-2 Motion Sensor",
+    "020114": "DALI-2 Motion Sensor",
+    "020115": "DALI-2 Motion Sensor",
+    "020116": "DALI-2 Motion Sensor",
+    "020117": "DALI-2 Motion Sensor",
+    "020118": "DALI-2 Motion Sensor",
+    "020119": "DALI-2 Motion Sensor",
+    "020120": "DALI-2 Motion Sensor",
 }
 
-# Generate motion sensor variants (020101-020120) dynamically
-_MOTION_SENSOR_VARIANTS = {f"0201{i:02d}": "DALI-2 Motion Sensor" for i in range(1, 21)}
-
-DEVICE_MODEL_MAP: dict[str, str] = {**_BASE_DEVICE_MODEL_MAP, **_MOTION_SENSOR_VARIANTS}
-
-# Base device type mappings (human-readable names)
-_BASE_DEVICE_TYPE_MAP: dict[str, str] = {
+# Human-readable device type names
+DEVICE_TYPE_MAP: dict[str, str] = {
     "0101": "Dimmer",
     "0102": "CCT",
     "0103": "RGB",
@@ -50,12 +69,28 @@ _BASE_DEVICE_TYPE_MAP: dict[str, str] = {
     "0304": "4-Key Panel",
     "0306": "6-Key Panel",
     "0308": "8-Key Panel",
+    "020101": "Motion (1)",
+    "020102": "Motion (2)",
+    "020103": "Motion (3)",
+    "020104": "Motion (4)",
+    "020105": "Motion (5)",
+    "020106": "Motion (6)",
+    "020107": "Motion (7)",
+    "020108": "Motion (8)",
+    "020109": "Motion (9)",
+    "020110": "Motion (10)",
+    "020111": "Motion (11)",
+    "020112": "Motion (12)",
+    "020113": "Motion (13)",
+    "020114": "Motion (14)",
+    "020115": "Motion (15)",
+    "020116": "Motion (16)",
+    "020117": "Motion (17)",
+    "020118": "Motion (18)",
+    "020119": "Motion (19)",
+    "020120": "Motion (20)",
 }
-
-# Generate motion sensor type variants (020101-020120) dynamically
-_MOTION_TYPE_VARIANTS = {f"0201{i:02d}": f"Motion ({i})" for i in range(1, 21)}
-
-DEVICE_TYPE_MAP: dict[str, str] = {**_BASE_DEVICE_TYPE_MAP, **_MOTION_TYPE_VARIANTS}
+# --- End generated ---
 
 COLOR_MODE_MAP = {
     "0102": "color_temp",  # CCT
@@ -1,9 +1,8 @@
 """Dali Gateway Device"""
 
-import colorsys
 from typing import Any, Callable, Dict, Iterable, List, Protocol, Tuple
 
-from .base import DaliObjectBase
+from .base import DaliObjectBase, create_property
 from .const import (
     COLOR_MODE_MAP,
     DPID_BRIGHTNESS,
@@ -11,7 +10,9 @@ from .const import (
     DPID_HSV_COLOR,
     DPID_POWER,
     DPID_WHITE_LEVEL,
+    HSV_HEX_FORMAT,
 )
+from .helper import rgb_to_hsv_hex
 from .types import (
     CallbackEventType,
     DeviceParamType,
@@ -34,6 +35,8 @@ class SupportsDeviceCommands(Protocol):
         channel: int,
         address: int,
         properties: List[Dict[str, Any]],
+        *,
+        coalesce: bool = True,
     ) -> None:
         raise NotImplementedError
 
@@ -145,62 +148,51 @@ class Device(DaliObjectBase):
         hs_color: Tuple[float, float] | None = None,
         rgbw_color: Tuple[float, float, float, float] | None = None,
     ) -> None:
-        properties = [self._create_property(DPID_POWER, "bool", True)]
+        properties = [create_property(DPID_POWER, "bool", True)]
 
         if brightness is not None:
             properties.append(
-                self._create_property(
-                    DPID_BRIGHTNESS, "uint16", brightness * 1000 / 255
-                )
+                create_property(DPID_BRIGHTNESS, "uint16", brightness * 1000 / 255)
             )
 
         if color_temp_kelvin is not None:
             properties.append(
-                self._create_property(DPID_COLOR_TEMP, "uint16", color_temp_kelvin)
+                create_property(DPID_COLOR_TEMP, "uint16", color_temp_kelvin)
             )
 
         if hs_color:
             h, s = hs_color
-            h_hex = f"{int(h):04x}"
-            s_hex = f"{int(s * 1000 / 100):04x}"
-            v_hex = f"{1000:04x}"
-            properties.append(
-                self._create_property(
-                    DPID_HSV_COLOR, "string", f"{h_hex}{s_hex}{v_hex}"
-                )
-            )
+            hsv_hex = HSV_HEX_FORMAT % (int(h), int(s * 1000 / 100), 1000)
+            properties.append(create_property(DPID_HSV_COLOR, "string", hsv_hex))
 
         if rgbw_color:
             r, g, b, w = rgbw_color
-            if any([r, g, b]):
-                h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                h_hex = f"{int(h * 360):04x}"
-                s_hex = f"{int(s * 1000):04x}"
-                v_hex = f"{int(v * 1000):04x}"
+            if r or g or b:
                 properties.append(
-                    self._create_property(
-                        DPID_HSV_COLOR, "string", f"{h_hex}{s_hex}{v_hex}"
-                    )
+                    create_property(DPID_HSV_COLOR, "string", rgb_to_hsv_hex(r, g, b))
                 )
 
             if w > 0:
-                properties.append(
-                    self._create_property(DPID_WHITE_LEVEL, "uint8", int(w))
-                )
+                properties.append(create_property(DPID_WHITE_LEVEL, "uint8", int(w)))
 
         self._send_properties(properties)
 
     def turn_off(self) -> None:
-        properties = [self._create_property(DPID_POWER, "bool", False)]
+        properties = [create_property(DPID_POWER, "bool", False)]
         self._send_properties(properties)
 
     def read_status(self) -> None:
         self._client.command_read_dev(self.dev_type, self.channel, self.address)
 
     def press_button(self, button_id: int, event_type: int = 1) -> None:
-        properties = [self._create_property(button_id, "uint8", event_type)]
-
-        self._send_properties(properties)
+        # Presses are events: never let a later one replace a queued one
+        self._client.command_write_dev(
+            self.dev_type,
+            self.channel,
+            self.address,
+            [create_property(button_id, "uint8", event_type)],
+            coalesce=False,
+        )
 
     def set_sensor_enabled(self, enabled: bool) -> None:
         self._client.command_set_sensor_on_off(
@@ -5,24 +5,55 @@ import contextlib
 import json
 import logging
 import socket
-from typing import Any, Dict, List, Set
+import sys
+import time
+from typing import Any, Coroutine, Dict, List, Tuple
 
 from .gateway import DaliGateway
+from .helper import json_loads
 from .udp_client import MessageCryptor, MulticastSender, NetworkManager
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _parse_channel(value: Any) -> int | None:
+    """Return value as a non-negative channel number, or None if it is not one."""
+    if type(value) is int:
+        return value if value >= 0 else None
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+class _DiscoveryDone(Exception):
+    """Raised by a discovery loop to end the discovery task group."""
+
+
 class DaliGatewayDiscovery:
     """Dali Gateway Discovery"""
 
     DISCOVERY_TIMEOUT: float = 180.0
     SEND_INTERVAL: float = 2.0
+    MESSAGE_REFRESH_INTERVAL: float = 300.0
 
     def __init__(self) -> None:
         self.network_manager = NetworkManager()
         self.cryptor = MessageCryptor()
         self.sender = MulticastSender()
+        # gw_sn -> (created_at, message); refreshed so the random key rotates
+        self._messages: Dict[str | None, Tuple[float, bytes]] = {}
+        self._get_discovery_message(None)
+
+    def _get_discovery_message(self, gw_sn: str | None) -> bytes:
+        """Return a cached discovery message, rebuilding it once it is stale."""
+        now = time.monotonic()
+        cached = self._messages.get(gw_sn)
+        if cached is not None and now - cached[0] < self.MESSAGE_REFRESH_INTERVAL:
+            return cached[1]
+
+        message = self.cryptor.prepare_discovery_message(gw_sn)
+        self._messages[gw_sn] = (now, message)
+        return message
 
     async def discover_gateways(self, gw_sn: str | None = None) -> List[DaliGateway]:
         _LOGGER.info(
@@ -38,7 +69,7 @@ class DaliGatewayDiscovery:
             )
             return []
 
-        message = self.cryptor.prepare_discovery_message(gw_sn)
+        message = self._get_discovery_message(gw_sn)
         listen_sock = self.sender.create_listener_socket(interfaces)
 
         try:
@@ -59,29 +90,38 @@ class DaliGatewayDiscovery:
     ) -> List[DaliGateway]:
         start_time = asyncio.get_running_loop().time()
         first_gateway_found = asyncio.Event()
-        unique_gateways: List[DaliGateway] = []
-        seen_sns: Set[str] = set()
+        gateways: Dict[str, DaliGateway] = {}
 
-        # Sender task
-        sender_task = asyncio.create_task(
-            self._sender_loop(interfaces, message, first_gateway_found, start_time)
+        sender = self._sender_loop(interfaces, message, first_gateway_found, start_time)
+        receiver = self._receiver_loop(
+            sock, first_gateway_found, start_time, gateways, gw_sn
         )
 
-        # Receiver task
-        receiver_task = asyncio.create_task(
-            self._receiver_loop(
-                sock, first_gateway_found, start_time, unique_gateways, seen_sns, gw_sn
-            )
-        )
+        if sys.version_info >= (3, 11):
+            # Whichever loop finishes first raises _DiscoveryDone so the
+            # TaskGroup cancels its sibling in one shot
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    task_group.create_task(self._finish_discovery(sender))
+                    task_group.create_task(self._finish_discovery(receiver))
+            except BaseExceptionGroup as err:  # noqa: F821 - builtin since 3.11
+                _, rest = err.split(_DiscoveryDone)
+                if rest is not None:
+                    raise rest.exceptions[0] from rest
+            return list(gateways.values())
 
-        _, pending = await asyncio.wait(
-            [sender_task, receiver_task], return_when=asyncio.FIRST_COMPLETED
-        )
+        tasks = [asyncio.create_task(sender), asyncio.create_task(receiver)]
+        _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
         for task in pending:
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await task
-        return unique_gateways
+        return list(gateways.values())
+
+    @staticmethod
+    async def _finish_discovery(loop_coro: Coroutine[Any, Any, None]) -> None:
+        await loop_coro
+        raise _DiscoveryDone
 
     async def _sender_loop(
         self,
@@ -90,8 +130,9 @@ class DaliGatewayDiscovery:
         first_gateway_found: asyncio.Event,
         start_time: float,
     ) -> None:
+        loop = asyncio.get_running_loop()
         while not first_gateway_found.is_set():
-            if asyncio.get_running_loop().time() - start_time >= self.DISCOVERY_TIMEOUT:
+            if loop.time() - start_time >= self.DISCOVERY_TIMEOUT:
                 _LOGGER.info(
                     "Discovery timeout reached after %.1f seconds",
                     self.DISCOVERY_TIMEOUT,
@@ -113,23 +154,25 @@ class DaliGatewayDiscovery:
         sock: socket.socket,
         first_gateway_found: asyncio.Event,
         start_time: float,
-        unique_gateways: List[DaliGateway],
-        seen_sns: Set[str],
+        gateways: Dict[str, DaliGateway],
         gw_sn: str | None = None,
     ) -> None:
+        loop = asyncio.get_running_loop()
         while not first_gateway_found.is_set():
-            if asyncio.get_running_loop().time() - start_time >= self.DISCOVERY_TIMEOUT:
+            remaining = self.DISCOVERY_TIMEOUT - (loop.time() - start_time)
+            if remaining <= 0:
                 break
 
             addr = None
             try:
-                await asyncio.sleep(0.1)
-                data, addr = sock.recvfrom(1024)
+                data, addr = await asyncio.wait_for(
+                    self._sock_recvfrom(loop, sock), timeout=remaining
+                )
 
-                response_json = json.loads(data.decode("utf-8"))
+                response_json = json_loads(data)
                 raw_data = response_json.get("data")
 
-                if raw_data and raw_data.get("gwSn") not in seen_sns:
+                if raw_data and raw_data.get("gwSn") not in gateways:
                     if gateway := self._process_gateway_data(raw_data, gw_sn):
                         _LOGGER.info(
                             "Discovered gateway: %s (%s) at %s:%s",
@@ -138,8 +181,7 @@ class DaliGatewayDiscovery:
                             gateway.gw_ip,
                             gateway.port,
                         )
-                        unique_gateways.append(gateway)
-                        seen_sns.add(gateway.gw_sn)
+                        gateways[gateway.gw_sn] = gateway
                         first_gateway_found.set()
                         break
 
@@ -151,8 +193,17 @@ class DaliGatewayDiscovery:
                     data[:100] if data else "<empty>",
                 )
                 continue
-            except (BlockingIOError, asyncio.CancelledError):
+            except (AttributeError, ValueError, TypeError) as exc:
+                # Unexpected payload shape or undecodable credentials: skip
+                # the datagram and keep listening
+                _LOGGER.warning(
+                    "Malformed discovery response from %s: %s",
+                    addr or "unknown",
+                    exc,
+                )
                 continue
+            except asyncio.TimeoutError:
+                break
             except OSError as exc:
                 _LOGGER.error(
                     "Socket error in receiver loop - this may prevent discovery: %s",
@@ -160,6 +211,32 @@ class DaliGatewayDiscovery:
                 )
                 break
 
+    @staticmethod
+    async def _sock_recvfrom(
+        loop: asyncio.AbstractEventLoop, sock: socket.socket
+    ) -> Tuple[bytes, Any]:
+        """Wait until a datagram is readable on the non-blocking socket."""
+        if sys.version_info >= (3, 11):
+            return await loop.sock_recvfrom(sock, 1024)
+
+        future: asyncio.Future[Tuple[bytes, Any]] = loop.create_future()
+
+        def _on_readable() -> None:
+            if future.done():
+                return
+            try:
+                future.set_result(sock.recvfrom(1024))
+            except BlockingIOError:
+                return
+            except OSError as exc:
+                future.set_exception(exc)
+
+        loop.add_reader(sock.fileno(), _on_readable)
+        try:
+            return await future
+        finally:
+            loop.remove_reader(sock.fileno())
+
     def _process_gateway_data(
         self, raw_data: Any, requested_gw_sn: str | None = None
     ) -> DaliGateway | None:
@@ -193,9 +270,9 @@ class DaliGatewayDiscovery:
 
         gateway_name = raw_data.get("name") or f"Dali Gateway {gw_sn}"
         channel_total = [
-            int(ch)
-            for ch in raw_data.get("channelTotal", [])
-            if isinstance(ch, (int, str)) and str(ch).isdigit()
+            ch
+            for ch in map(_parse_channel, raw_data.get("channelTotal") or ())
+            if ch is not None
         ]
 
         return DaliGateway(
@@ -3,6 +3,8 @@
 import asyncio
 import contextlib
 from enum import Enum, auto
+from importlib import resources
+import itertools
 import json
 import logging
 import random
@@ -46,6 +48,8 @@ from .helper import (
     is_light_device,
     is_motion_sensor,
     is_panel_device,
+    json_dumps,
+    json_loads,
     parse_illuminance_status,
     parse_light_status,
     parse_motion_status,
@@ -78,6 +82,39 @@ _RECONNECT_MAX_DELAY = 60.0  # seconds
 _RECONNECT_BACKOFF_MULTIPLIER = 2.0
 _RECONNECT_JITTER = 0.1  # ±10%
 
+# MQTT CONNACK codes meaning bad username/password (4) or not authorized (5)
+_AUTH_FAILURE_CODES = frozenset({4, 5})
+
+
+def _set_future_done(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_ssl_context: ssl.SSLContext | None = None
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    # as_file extracts the bundled cert to a temporary file if the package is zipped
+    with resources.as_file(CA_CERT_PATH) as ca_path:
+        context.load_verify_locations(str(ca_path))
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_REQUIRED
+    return context
+
+
+async def _get_ssl_context() -> ssl.SSLContext:
+    """Return the TLS context shared by all gateways, building it on first use.
+
+    Loading the CA file is blocking I/O, so the first build runs in the executor.
+    """
+    global _ssl_context  # noqa: PLW0603
+    if _ssl_context is None:
+        loop = asyncio.get_running_loop()
+        _ssl_context = await loop.run_in_executor(None, _create_ssl_context)
+    return _ssl_context
+
 
 class ConnectionState(Enum):
     """Connection state machine for gateway."""
@@ -111,6 +148,7 @@ class DaliGateway:
         self._username = username
         self._passwd = passwd
         self._is_tls = is_tls
+        self._tls_configured = False
         self._channel_total = (
             [int(ch) for ch in channel_total] if channel_total else [0]
         )
@@ -128,6 +166,10 @@ class DaliGateway:
         self._shutdown_requested = False
         self._connection_lock: asyncio.Lock | None = None  # Initialized in connect()
 
+        # msgId only has to be unique per message; seed from the clock so ids
+        # keep their timestamp shape and don't repeat across restarts
+        self._msg_ids = itertools.count(int(time.time()))
+
         self._sub_topic = f"/{self._gw_sn}/client/reciver/"
         self._pub_topic = f"/{self._gw_sn}/server/publish/"
 
@@ -151,14 +193,16 @@ class DaliGateway:
 
         self._connect_result: int | None = None
         self._connection_event = asyncio.Event()
+        self._version_event = asyncio.Event()
 
         self._mqtt_client.on_connect = self._on_connect
         self._mqtt_client.on_disconnect = self._on_disconnect
         self._mqtt_client.on_message = self._on_message
 
-        self._scenes_received = asyncio.Event()
-        self._groups_received = asyncio.Event()
-        self._devices_received = asyncio.Event()
+        # Resolved by the matching response handler; created per request
+        self._scenes_future: asyncio.Future[None] | None = None
+        self._groups_future: asyncio.Future[None] | None = None
+        self._devices_future: asyncio.Future[None] | None = None
         self._bus_scan_complete = asyncio.Event()
 
         self._scenes_result: list[Scene] = []
@@ -190,8 +234,14 @@ class DaliGateway:
             CallbackEventType.SENSOR_PARAM: {},
         }
 
-        self._pending_requests: Dict[str, Dict[str, Dict[str, Any]]] = {}
-        self._batch_timer: Dict[str, asyncio.TimerHandle] = {}  # cmd -> timer
+        # Pending requests per cmd, in call order. State-like requests coalesce
+        # in place per device; event-like ones (button presses) are all sent
+        self._pending_requests: Dict[str, List[Dict[str, Any]]] = {}
+        # cmd -> device key -> index of its coalescible entry in the list above
+        self._pending_request_slots: Dict[str, Dict[Tuple[str, int, int], int]] = {}
+        # Single shared flush tick for all pending cmds, armed only while
+        # there is something to send
+        self._batch_handle: asyncio.TimerHandle | None = None
 
         # Inbound callback batching with smart merging
         # Key: (event_type, dev_id, listener_id) -> (listener, merged_data)
@@ -227,8 +277,8 @@ class DaliGateway:
             "identifyDevRes": self._process_identify_dev_response,
         }
 
-    def _get_device_key(self, dev_type: str, channel: int, address: int) -> str:
-        return f"{dev_type}_{channel}_{address}"
+    def _next_msg_id(self) -> str:
+        return str(next(self._msg_ids))
 
     def _build_parameter(self, param: DeviceParamType) -> Dict[str, Any]:
         """Convert DeviceParamType to protocol format using snake_case to camelCase mapping."""
@@ -240,16 +290,36 @@ class DaliGateway:
         }
 
     def add_request(
-        self, cmd: str, dev_type: str, channel: int, address: int, data: Dict[str, Any]
+        self,
+        cmd: str,
+        dev_type: str,
+        channel: int,
+        address: int,
+        data: Dict[str, Any],
+        *,
+        coalesce: bool = True,
     ) -> None:
-        if cmd not in self._pending_requests:
-            self._pending_requests[cmd] = {}
+        pending = self._pending_requests.setdefault(cmd, [])
+        if not coalesce:
+            # A later state write for this device must not merge into an
+            # entry queued before this event; start a new one after it
+            self._pending_request_slots.get(cmd, {}).pop(
+                (dev_type, channel, address), None
+            )
+            pending.append(data)
+            self._schedule_batch(cmd)
+            return
 
-        device_key = self._get_device_key(dev_type, channel, address)
+        slots = self._pending_request_slots.setdefault(cmd, {})
+        device_key = (dev_type, channel, address)
+        slot = slots.get(device_key)
 
-        # Merge properties instead of overwriting the entire data
-        if device_key in self._pending_requests[cmd]:
-            existing_data = self._pending_requests[cmd][device_key]
+        if slot is None:
+            slots[device_key] = len(pending)
+            pending.append(data)
+        else:
+            # Merge properties instead of overwriting the entire data
+            existing_data = pending[slot]
             if "property" in existing_data and "property" in data:
                 # Merge properties, avoiding duplicates by dpid
                 existing_properties = {
@@ -258,39 +328,48 @@ class DaliGateway:
                 new_properties = {prop["dpid"]: prop for prop in data["property"]}
                 existing_properties.update(new_properties)
                 data["property"] = list(existing_properties.values())
+            # Keep the queue position of the first write for this device
+            pending[slot] = data
 
-        self._pending_requests[cmd][device_key] = data
+        self._schedule_batch(cmd)
 
-        if self._batch_timer.get(cmd) is None:
-            if self._loop is None or not self._loop.is_running():
-                # Fallback: flush immediately if no event loop available
-                self._flush_batch(cmd)
-                return
-            self._batch_timer[cmd] = self._loop.call_later(
-                INBOUND_CALLBACK_BATCH_WINDOW_MS / 1000.0, self._flush_batch, cmd
+    def _schedule_batch(self, cmd: str) -> None:
+        if self._loop is None or not self._loop.is_running():
+            # Fallback: flush immediately if no event loop available
+            self._flush_batch(cmd)
+            return
+        if self._batch_handle is None:
+            self._batch_handle = self._loop.call_later(
+                INBOUND_CALLBACK_BATCH_WINDOW_MS / 1000.0, self._flush_all_batches
             )
 
+    def _flush_all_batches(self) -> None:
+        """Flush every pending cmd bucket on the shared batch tick."""
+        self._batch_handle = None
+        for cmd in list(self._pending_requests):
+            self._flush_batch(cmd)
+
     def _flush_batch(self, cmd: str) -> None:
-        if not self._pending_requests.get(cmd):
+        pending = self._pending_requests.get(cmd)
+        if not pending:
             return
 
-        batch_data: List[Dict[str, Any]] = list(self._pending_requests[cmd].values())
+        batch_data: List[Dict[str, Any]] = list(pending)
 
         command: Dict[str, Any] = {
             "cmd": cmd,
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
             "data": batch_data,
         }
 
-        self._mqtt_client.publish(self._pub_topic, json.dumps(command))
+        self._publish(command)
 
-        _LOGGER.debug(
-            "Gateway %s: Sent batch %s %s", self._gw_sn, cmd, json.dumps(command)
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Gateway %s: Sent batch %s %s", self._gw_sn, cmd, command)
 
-        self._pending_requests[cmd].clear()
-        self._batch_timer.pop(cmd, None)
+        pending.clear()
+        self._pending_request_slots.pop(cmd, None)
 
     def __repr__(self) -> str:
         return (
@@ -298,6 +377,17 @@ class DaliGateway:
             f"port={self._port}, name={self._name})"
         )
 
+    def _publish(self, payload: Dict[str, Any]) -> None:
+        """Encode and publish a command, warning if paho did not accept it."""
+        info = self._mqtt_client.publish(self._pub_topic, json_dumps(payload))
+        if info.rc != paho_mqtt.MQTT_ERR_SUCCESS:
+            _LOGGER.warning(
+                "Gateway %s: Failed to publish %s: %s",
+                self._gw_sn,
+                payload.get("cmd"),
+                paho_mqtt.error_string(info.rc),
+            )
+
     def _publish_command(self, cmd: str, **kwargs: Any) -> None:
         """Publish a command to the MQTT broker.
 
@@ -307,11 +397,11 @@ class DaliGateway:
         """
         payload: Dict[str, Any] = {
             "cmd": cmd,
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
             **kwargs,
         }
-        self._mqtt_client.publish(self._pub_topic, json.dumps(payload))
+        self._publish(payload)
 
     @property
     def gw_sn(self) -> str:
@@ -367,6 +457,16 @@ class DaliGateway:
         else:
             event.set()
 
+    def _resolve_future_threadsafe(self, future: asyncio.Future[None] | None) -> None:
+        """Resolve a pending response future in a thread-safe manner."""
+        if future is None:
+            return
+        loop = future.get_loop()
+        if loop.is_running():
+            loop.call_soon_threadsafe(_set_future_done, future)
+        else:
+            _set_future_done(future)
+
     def register_listener(
         self,
         event_type: CallbackEventType,
@@ -568,14 +668,29 @@ class DaliGateway:
     def _on_message(
         self, client: paho_mqtt.Client, userdata: Any, msg: paho_mqtt.MQTTMessage
     ) -> None:
-        try:
-            payload_json = json.loads(msg.payload.decode("utf-8", errors="replace"))
-            _LOGGER.debug(
-                "Gateway %s: Received MQTT message on topic %s: %s",
-                self._gw_sn,
-                msg.topic,
-                payload_json,
+        # Keep paho's network thread to I/O only: decoding and handlers run on
+        # the event loop when one is available
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(
+                self._handle_message, msg.topic, msg.payload
             )
+        else:
+            self._handle_message(msg.topic, msg.payload)
+
+    def _handle_message(self, topic: str, payload: bytes) -> None:
+        try:
+            try:
+                payload_json = json_loads(payload)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # Rare non-UTF-8 payloads: replace bad bytes and parse again
+                payload_json = json_loads(payload.decode("utf-8", errors="replace"))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Gateway %s: Received MQTT message on topic %s: %s",
+                    self._gw_sn,
+                    topic,
+                    payload_json,
+                )
 
             cmd = payload_json.get("cmd")
             if not cmd:
@@ -599,7 +714,7 @@ class DaliGateway:
             _LOGGER.error(
                 "Gateway %s: Failed to decode MQTT message payload: %s",
                 self._gw_sn,
-                msg.payload,
+                payload,
             )
         except (ValueError, KeyError, TypeError) as e:
             _LOGGER.error(
@@ -616,16 +731,22 @@ class DaliGateway:
             )
             return
 
+        # Nothing to do for devices without an online-status listener
+        online_listeners = self._device_listeners[CallbackEventType.ONLINE_STATUS]
+        if not online_listeners:
+            return
+
+        gw_sn = self._gw_sn
+        notify = self._notify_listeners
         for data in data_list:
             dev_id = gen_device_unique_id(
-                data.get("devType"),
-                data.get("channel"),
-                data.get("address"),
-                self._gw_sn,
+                data.get("devType"), data.get("channel"), data.get("address"), gw_sn
             )
+            if dev_id not in online_listeners:
+                continue
 
             available: bool = data.get("status", False)
-            self._notify_listeners(CallbackEventType.ONLINE_STATUS, dev_id, available)
+            notify(CallbackEventType.ONLINE_STATUS, dev_id, available)
 
     def _process_device_status(self, payload: Dict[str, Any]) -> None:
         data = payload.get("data")
@@ -635,8 +756,9 @@ class DaliGateway:
             )
             return
 
+        dev_type = data.get("devType")
         dev_id = gen_device_unique_id(
-            data.get("devType"), data.get("channel"), data.get("address"), self._gw_sn
+            dev_type, data.get("channel"), data.get("address"), self._gw_sn
         )
 
         if not dev_id:
@@ -644,7 +766,6 @@ class DaliGateway:
             return
 
         property_list = data.get("property", [])
-        dev_type = data.get("devType")
 
         if dev_type and is_light_device(dev_type):
             light_status = parse_light_status(property_list)
@@ -685,7 +806,7 @@ class DaliGateway:
         """Process identifyDev response.
 
         This method exists as a hook for subclasses to override.
-        The response is already logged by _on_message.
+        The response is already logged by _handle_message.
         """
 
     def _process_energy_report(self, payload: Dict[str, Any]) -> None:
@@ -706,21 +827,29 @@ class DaliGateway:
             _LOGGER.warning("Failed to generate device ID from data: %s", data)
             return
 
-        property_list = data.get("property", [])
-        for prop in property_list:
-            if prop.get("dpid") == DPID_ENERGY:
-                try:
-                    energy_value = float(prop.get("value", "0"))
+        energy_prop = next(
+            (
+                prop
+                for prop in data.get("property", [])
+                if prop.get("dpid") == DPID_ENERGY
+            ),
+            None,
+        )
+        if energy_prop is None:
+            return
 
-                    self._notify_listeners(
-                        CallbackEventType.ENERGY_REPORT, dev_id, energy_value
-                    )
-                except (ValueError, TypeError) as e:
-                    _LOGGER.error("Error converting energy value: %s", str(e))
+        try:
+            energy_value = float(energy_prop.get("value", "0"))
+        except (ValueError, TypeError) as e:
+            _LOGGER.error("Error converting energy value: %s", str(e))
+            return
+
+        self._notify_listeners(CallbackEventType.ENERGY_REPORT, dev_id, energy_value)
 
     def _process_get_version_response(self, payload_json: Dict[str, Any]) -> None:
         self.software_version = payload_json.get("data", {}).get("swVersion", "")
         self.firmware_version = payload_json.get("data", {}).get("fwVersion", "")
+        self._version_event.set()
 
     def _process_get_energy_response(self, payload_json: Dict[str, Any]) -> None:
         data_list = payload_json.get("data")
@@ -842,10 +971,11 @@ class DaliGateway:
                 )
 
             if search_status in {0, 1}:
-                self._set_event_threadsafe(self._devices_received)
+                self._resolve_future_threadsafe(self._devices_future)
 
     def _process_get_scene_response(self, payload_json: Dict[str, Any]) -> None:
         self._scenes_result.clear()
+        seen_ids: set[str] = set()
         for channel_scenes in payload_json.get("scene", []):
             channel = channel_scenes.get("channel", 0)
 
@@ -854,12 +984,10 @@ class DaliGateway:
                 name = str(scene_data.get("name", ""))
                 area_id = str(scene_data.get("areaId", ""))
 
-                if any(
-                    existing.unique_id
-                    == gen_scene_unique_id(scene_id, channel, self._gw_sn)
-                    for existing in self._scenes_result
-                ):
+                unique_id = gen_scene_unique_id(scene_id, channel, self._gw_sn)
+                if unique_id in seen_ids:
                     continue
+                seen_ids.add(unique_id)
 
                 self._scenes_result.append(
                     Scene(
@@ -872,10 +1000,11 @@ class DaliGateway:
                     )
                 )
 
-        self._set_event_threadsafe(self._scenes_received)
+        self._resolve_future_threadsafe(self._scenes_future)
 
     def _process_get_group_response(self, payload_json: Dict[str, Any]) -> None:
         self._groups_result.clear()
+        seen_ids: set[str] = set()
         for channel_groups in payload_json.get("group", []):
             channel = channel_groups.get("channel", 0)
 
@@ -884,12 +1013,10 @@ class DaliGateway:
                 name = str(group_data.get("name", ""))
                 area_id = str(group_data.get("areaId", ""))
 
-                if any(
-                    existing.unique_id
-                    == gen_group_unique_id(group_id, channel, self._gw_sn)
-                    for existing in self._groups_result
-                ):
+                unique_id = gen_group_unique_id(group_id, channel, self._gw_sn)
+                if unique_id in seen_ids:
                     continue
+                seen_ids.add(unique_id)
 
                 self._groups_result.append(
                     Group(
@@ -902,7 +1029,7 @@ class DaliGateway:
                     )
                 )
 
-        self._set_event_threadsafe(self._groups_received)
+        self._resolve_future_threadsafe(self._groups_future)
 
     def _process_read_group_response(self, payload: Dict[str, Any]) -> None:
         group_id = payload.get("groupId", 0)
@@ -1074,21 +1201,18 @@ class DaliGateway:
         )
 
     async def _setup_ssl(self) -> None:
+        # paho only accepts a TLS context once per client
+        if self._tls_configured:
+            return
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self._setup_ssl_sync)
+            context = await _get_ssl_context()
+            self._mqtt_client.tls_set_context(context)  # pyright: ignore[reportUnknownMemberType]
         except Exception as e:
             _LOGGER.error("Failed to configure SSL/TLS: %s", str(e))
             raise DaliGatewayError(
                 f"SSL/TLS configuration failed: {e}", self._gw_sn
             ) from e
-
-    def _setup_ssl_sync(self) -> None:
-        context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        context.load_verify_locations(str(CA_CERT_PATH))
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_REQUIRED
-        self._mqtt_client.tls_set_context(context)  # pyright: ignore[reportUnknownMemberType]
+        self._tls_configured = True
         _LOGGER.debug("SSL/TLS configured with CA certificate: %s", CA_CERT_PATH)
 
     def get_credentials(self) -> tuple[str, str]:
@@ -1306,7 +1430,7 @@ class DaliGateway:
         self._mqtt_client.loop_stop()
         self._connection_state = ConnectionState.DISCONNECTED
 
-        if self._connect_result is not None and self._connect_result in (4, 5):
+        if self._connect_result in _AUTH_FAILURE_CODES:
             _LOGGER.error(
                 "Authentication failed for gateway %s (code %s) with credentials user='%s'. "
                 "Please press the gateway button and retry",
@@ -1358,13 +1482,21 @@ class DaliGateway:
 
     def _request_version(self) -> None:
         """Request gateway version information via MQTT."""
-        payload = {
-            "cmd": "getVersion",
-            "msgId": str(int(time.time())),
-            "gwSn": self._gw_sn,
-        }
         _LOGGER.debug("Gateway %s: Requesting version information", self._gw_sn)
-        self._mqtt_client.publish(self._pub_topic, json.dumps(payload))
+        self._publish_command("getVersion")
+
+    async def wait_for_version(self, timeout: float = 3.0) -> bool:
+        """Wait for the getVersion response requested on connect.
+
+        Returns True once a software or firmware version is known, False if
+        none arrived within *timeout* seconds.
+        """
+        if not (self.software_version or self.firmware_version):
+            try:
+                await asyncio.wait_for(self._version_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return False
+        return bool(self.software_version or self.firmware_version)
 
     async def identify_gateway(self) -> None:
         """Make the gateway's indicator light blink to identify it physically.
@@ -1381,21 +1513,13 @@ class DaliGateway:
         self._read_group_events[group_key] = asyncio.Event()
         self._read_group_results.pop(group_key, None)  # Clear any previous result
 
-        payload: Dict[str, Any] = {
-            "cmd": "readGroup",
-            "msgId": str(int(time.time())),
-            "gwSn": self._gw_sn,
-            "channel": channel,
-            "groupId": group_id,
-        }
-
         _LOGGER.debug(
             "Gateway %s: Sending read group command for group %s channel %s",
             self._gw_sn,
             group_id,
             channel,
         )
-        self._mqtt_client.publish(self._pub_topic, json.dumps(payload))
+        self._publish_command("readGroup", channel=channel, groupId=group_id)
 
         try:
             await asyncio.wait_for(
@@ -1452,21 +1576,13 @@ class DaliGateway:
         self._read_scene_events[scene_key] = asyncio.Event()
         self._read_scene_results.pop(scene_key, None)  # Clear any previous result
 
-        payload: Dict[str, Any] = {
-            "cmd": "readScene",
-            "msgId": str(int(time.time())),
-            "gwSn": self._gw_sn,
-            "channel": channel,
-            "sceneId": scene_id,
-        }
-
         _LOGGER.debug(
             "Gateway %s: Sending read scene command for scene %s channel %s",
             self._gw_sn,
             scene_id,
             channel,
         )
-        self._mqtt_client.publish(self._pub_topic, json.dumps(payload))
+        self._publish_command("readScene", channel=channel, sceneId=scene_id)
 
         try:
             await asyncio.wait_for(
@@ -1517,21 +1633,14 @@ class DaliGateway:
         return result
 
     async def discover_devices(self) -> list[Device]:
-        self._devices_received = asyncio.Event()
+        self._devices_future = asyncio.get_running_loop().create_future()
         self._devices_result.clear()
         self._devices_seen_ids.clear()
-        search_payload = {
-            "cmd": "searchDev",
-            "searchFlag": "exited",
-            "msgId": str(int(time.time())),
-            "gwSn": self._gw_sn,
-        }
-
         _LOGGER.debug("Gateway %s: Sending device discovery command", self._gw_sn)
-        self._mqtt_client.publish(self._pub_topic, json.dumps(search_payload))
+        self._publish_command("searchDev", searchFlag="exited")
 
         try:
-            await asyncio.wait_for(self._devices_received.wait(), timeout=30.0)
+            await asyncio.wait_for(self._devices_future, timeout=30.0)
         except asyncio.TimeoutError:
             _LOGGER.warning(
                 "Gateway %s: Timeout waiting for device discovery response", self._gw_sn
@@ -1572,7 +1681,7 @@ class DaliGateway:
             "searchFlag": "busDevice",
             "channel": channels,
             "AddrAssignment": "auto",
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
         }
 
@@ -1581,10 +1690,8 @@ class DaliGateway:
             self._gw_sn,
             channels,
         )
-        _LOGGER.debug(
-            "Gateway %s: Bus scan payload: %s", self._gw_sn, json.dumps(search_payload)
-        )
-        self._mqtt_client.publish(self._pub_topic, json.dumps(search_payload))
+        _LOGGER.debug("Gateway %s: Bus scan payload: %s", self._gw_sn, search_payload)
+        self._publish(search_payload)
 
         try:
             await asyncio.wait_for(
@@ -1633,17 +1740,16 @@ class DaliGateway:
         stop_payload: dict[str, Any] = {
             "cmd": "searchDev",
             "searchFlag": "stop",
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
         }
         if self._bus_scan_channels:
             stop_payload["channel"] = self._bus_scan_channels
 
-        stop_json = json.dumps(stop_payload)
         _LOGGER.debug(
-            "Gateway %s: Sending bus scan stop command: %s", self._gw_sn, stop_json
+            "Gateway %s: Sending bus scan stop command: %s", self._gw_sn, stop_payload
         )
-        self._mqtt_client.publish(self._pub_topic, stop_json)
+        self._publish(stop_payload)
 
         # Mark as cancelled and proactively unblock scan_bus()
         # Don't rely on gateway response as its behavior is not fully known
@@ -1662,20 +1768,13 @@ class DaliGateway:
         (timeout, errors, etc.) are logged but not included in the result.
         """
         # Phase 1: Discover basic group list
-        self._groups_received = asyncio.Event()
+        self._groups_future = asyncio.get_running_loop().create_future()
         self._groups_result.clear()
-        search_payload = {
-            "cmd": "getGroup",
-            "msgId": str(int(time.time())),
-            "getFlag": "exited",
-            "gwSn": self._gw_sn,
-        }
-
         _LOGGER.debug("Gateway %s: Sending group discovery command", self._gw_sn)
-        self._mqtt_client.publish(self._pub_topic, json.dumps(search_payload))
+        self._publish_command("getGroup", getFlag="exited")
 
         try:
-            await asyncio.wait_for(self._groups_received.wait(), timeout=30.0)
+            await asyncio.wait_for(self._groups_future, timeout=30.0)
         except asyncio.TimeoutError:
             _LOGGER.warning(
                 "Gateway %s: Timeout waiting for group discovery response", self._gw_sn
@@ -1766,20 +1865,13 @@ class DaliGateway:
         (timeout, errors, etc.) are logged but not included in the result.
         """
         # Phase 1: Discover basic scene list
-        self._scenes_received = asyncio.Event()
+        self._scenes_future = asyncio.get_running_loop().create_future()
         self._scenes_result.clear()
-        search_payload = {
-            "cmd": "getScene",
-            "msgId": str(int(time.time())),
-            "getFlag": "exited",
-            "gwSn": self._gw_sn,
-        }
-
         _LOGGER.debug("Gateway %s: Sending scene discovery command", self._gw_sn)
-        self._mqtt_client.publish(self._pub_topic, json.dumps(search_payload))
+        self._publish_command("getScene", getFlag="exited")
 
         try:
-            await asyncio.wait_for(self._scenes_received.wait(), timeout=30.0)
+            await asyncio.wait_for(self._scenes_future, timeout=30.0)
         except asyncio.TimeoutError:
             _LOGGER.warning(
                 "Gateway %s: Timeout waiting for scene discovery response", self._gw_sn
@@ -1866,7 +1958,14 @@ class DaliGateway:
         channel: int,
         address: int,
         properties: List[Dict[str, Any]],
+        *,
+        coalesce: bool = True,
     ) -> None:
+        """Queue a writeDev for the next batch.
+
+        With coalesce=False the write is never merged with other pending
+        writes to the device, e.g. for button press events.
+        """
         self.add_request(
             "writeDev",
             dev_type,
@@ -1878,6 +1977,7 @@ class DaliGateway:
                 "address": address,
                 "property": properties,
             },
+            coalesce=coalesce,
         )
 
     def command_read_dev(self, dev_type: str, channel: int, address: int) -> None:
@@ -1910,19 +2010,18 @@ class DaliGateway:
     ) -> None:
         command: Dict[str, Any] = {
             "cmd": "writeGroup",
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
             "channel": channel,
             "groupId": group_id,
             "data": properties,
         }
-        command_json = json.dumps(command)
         _LOGGER.debug(
             "Gateway %s: Sending writeGroup %s",
             self._gw_sn,
-            command_json,
+            command,
         )
-        self._mqtt_client.publish(self._pub_topic, command_json)
+        self._publish(command)
 
     def command_write_scene(self, scene_id: int, channel: int) -> None:
         self._publish_command("writeScene", channel=channel, sceneId=scene_id)
@@ -1976,18 +2075,17 @@ class DaliGateway:
 
         command: Dict[str, Any] = {
             "cmd": "setSensorArgv",
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
             "devType": dev_type,
             "channel": channel,
             "address": address,
             "data": data,
         }
-        command_json = json.dumps(command)
         _LOGGER.debug(
             "Gateway %s: Sending setSensorArgv command: %s", self._gw_sn, command
         )
-        self._mqtt_client.publish(self._pub_topic, command_json)
+        self._publish(command)
 
     def command_get_sensor_argv(
         self, dev_type: str, channel: int, address: int
@@ -2041,7 +2139,7 @@ class DaliGateway:
 
         command: Dict[str, Any] = {
             "cmd": "setDevParam",
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
             "data": [
                 {
@@ -2052,11 +2150,10 @@ class DaliGateway:
                 }
             ],
         }
-        command_json = json.dumps(command)
         _LOGGER.debug(
             "Gateway %s: Sending setDevParam command: %s", self._gw_sn, command
         )
-        self._mqtt_client.publish(self._pub_topic, command_json)
+        self._publish(command)
 
     def command_set_dev_params(self, items: Sequence[DeviceParamCommand]) -> None:
         """Set parameters for multiple targets in one MQTT message."""
@@ -2090,17 +2187,16 @@ class DaliGateway:
 
         command: Dict[str, Any] = {
             "cmd": "setDevParam",
-            "msgId": str(int(time.time())),
+            "msgId": self._next_msg_id(),
             "gwSn": self._gw_sn,
             "data": data,
         }
-        command_json = json.dumps(command)
         _LOGGER.debug(
             "Gateway %s: Sending batch setDevParam command: %s",
             self._gw_sn,
             command,
         )
-        self._mqtt_client.publish(self._pub_topic, command_json)
+        self._publish(command)
 
     def restart_gateway(self) -> None:
         """Restart the gateway."""
@@ -1,10 +1,9 @@
 """Dali Gateway Group"""
 
-import colorsys
 import logging
 from typing import Any, Callable, Dict, List, Protocol, Tuple
 
-from .base import DaliObjectBase
+from .base import DaliObjectBase, create_property
 from .const import (
     DPID_BRIGHTNESS,
     DPID_COLOR_TEMP,
@@ -12,7 +11,7 @@ from .const import (
     DPID_POWER,
     DPID_WHITE_LEVEL,
 )
-from .helper import gen_group_unique_id
+from .helper import gen_group_unique_id, rgb_to_hsv_hex
 from .types import CallbackEventType, GroupDeviceType, ListenerCallback
 
 _LOGGER = logging.getLogger(__name__)
@@ -68,16 +67,16 @@ class Group(DaliObjectBase):
         return f"Group(name={self.name}, unique_id={self.unique_id})"
 
     def _send_properties(self, properties: List[Dict[str, Any]]) -> None:
-        _LOGGER.debug(
-            "Group %s (id=%d, ch=%d): Sending %d properties: %s",
-            self.name,
-            self.group_id,
-            self.channel,
-            len(properties),
-            properties,
-        )
-        for prop in properties:
-            self._client.command_write_group(self.group_id, self.channel, [prop])
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Group %s (id=%d, ch=%d): Sending %d properties: %s",
+                self.name,
+                self.group_id,
+                self.channel,
+                len(properties),
+                properties,
+            )
+        self._client.command_write_group(self.group_id, self.channel, properties)
 
     def turn_on(
         self,
@@ -85,46 +84,32 @@ class Group(DaliObjectBase):
         color_temp_kelvin: int | None = None,
         rgbw_color: Tuple[float, float, float, float] | None = None,
     ) -> None:
-        properties: List[Dict[str, Any]] = [
-            self._create_property(DPID_POWER, "bool", True)
-        ]
+        properties: List[Dict[str, Any]] = [create_property(DPID_POWER, "bool", True)]
 
         if brightness is not None:
             properties.append(
-                self._create_property(
-                    DPID_BRIGHTNESS, "uint16", brightness * 1000 / 255
-                )
+                create_property(DPID_BRIGHTNESS, "uint16", brightness * 1000 / 255)
             )
 
         if color_temp_kelvin is not None:
             properties.append(
-                self._create_property(DPID_COLOR_TEMP, "uint16", color_temp_kelvin)
+                create_property(DPID_COLOR_TEMP, "uint16", color_temp_kelvin)
             )
 
         if rgbw_color:
             r, g, b, w = rgbw_color
-            if any([r, g, b]):
-                h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                h_hex = f"{int(h * 360):04x}"
-                s_hex = f"{int(s * 1000):04x}"
-                v_hex = f"{int(v * 1000):04x}"
+            if r or g or b:
                 properties.append(
-                    self._create_property(
-                        DPID_HSV_COLOR, "string", f"{h_hex}{s_hex}{v_hex}"
-                    )
+                    create_property(DPID_HSV_COLOR, "string", rgb_to_hsv_hex(r, g, b))
                 )
 
             if w > 0:
-                properties.append(
-                    self._create_property(DPID_WHITE_LEVEL, "uint8", int(w))
-                )
+                properties.append(create_property(DPID_WHITE_LEVEL, "uint8", int(w)))
 
         self._send_properties(properties)
 
     def turn_off(self) -> None:
-        properties: List[Dict[str, Any]] = [
-            self._create_property(DPID_POWER, "bool", False)
-        ]
+        properties: List[Dict[str, Any]] = [create_property(DPID_POWER, "bool", False)]
         self._send_properties(properties)
 
     def register_listener(
@@ -1,8 +1,18 @@
 """Helper functions for Dali Gateway"""
 
 import colorsys
+import json
+from math import floor
 from typing import Any, Dict, List
 
+# Prefer orjson when installed (speedups extra); fall back to stdlib json
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False  # pyright: ignore[reportConstantRedefinition]
+
 from .const import (
     BUTTON_EVENTS,
     DEVICE_TYPE_MAP,
@@ -11,6 +21,7 @@ from .const import (
     DPID_HSV_COLOR,
     DPID_POWER,
     DPID_WHITE_LEVEL,
+    HSV_HEX_FORMAT,
 )
 from .types import (
     IlluminanceStatus,
@@ -22,6 +33,23 @@ from .types import (
 )
 
 
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)  # pyright: ignore[reportPossiblyUnboundVariable]
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str.
+
+    Raises json.JSONDecodeError (orjson's error subclasses it) on invalid input.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)  # pyright: ignore[reportPossiblyUnboundVariable]
+    return json.loads(data)
+
+
 def is_light_device(dev_type: str) -> bool:
     return dev_type.startswith("01")
 
@@ -67,6 +95,31 @@ def gen_scene_unique_id(scene_id: int, channel: int, gw_sn: str) -> str:
     return f"scene_{scene_id:04d}_{channel:04d}_{gw_sn}"
 
 
+def rgb_to_hsv_hex(r: float, g: float, b: float) -> str:
+    """Encode 0-255 RGB as the gateway's HSV string (hue 0-360, s/v 0-1000).
+
+    Works on the 0-255 values directly, which skips colorsys' normalisation
+    and avoids its off-by-one hue truncation for integer inputs.
+    """
+    max_c = r if r >= g and r >= b else (g if g >= b else b)
+    min_c = r if r <= g and r <= b else (g if g <= b else b)
+    # floor == int() truncation for these non-negative values, and is cheaper
+    value = floor(max_c * 1000 / 255)
+    diff = max_c - min_c
+    if not diff:
+        return HSV_HEX_FORMAT % (0, 0, value)
+
+    if r == max_c:
+        hue = 60 * (g - b) / diff
+        if hue < 0:
+            hue += 360
+    elif g == max_c:
+        hue = 120 + 60 * (b - r) / diff
+    else:
+        hue = 240 + 60 * (r - g) / diff
+    return HSV_HEX_FORMAT % (floor(hue), floor(diff * 1000 / max_c), value)
+
+
 def parse_light_status(property_list: List[Dict[str, Any]]) -> LightStatus:
     """Parse raw property list into LightStatus object for light devices"""
 
@@ -1,43 +1,75 @@
 """UDP client utilities for DALI Gateway communication"""
 
-import asyncio
 import contextlib
+from functools import lru_cache
 import ipaddress
-import json
 import logging
 import socket
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 import uuid
 
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 import psutil
 
+from .helper import json_dumps
+
 _LOGGER = logging.getLogger(__name__)
 
+_ENCRYPTION_IV = b"0000000000101111"
+_MULTICAST_ADDR = "239.255.255.250"
+_MULTICAST_ADDR_BYTES = socket.inet_aton(_MULTICAST_ADDR)
+
+
+@lru_cache(maxsize=32)
+def _cipher_for_key(key_bytes: bytes) -> Cipher:
+    """Return a cached AES-CTR cipher so the key schedule is built once per key."""
+    # Protocol keys are always 16 bytes; pin AES-128 to skip key-size dispatch
+    algorithm = (
+        algorithms.AES128(key_bytes)
+        if len(key_bytes) == 16
+        else algorithms.AES(key_bytes)
+    )
+    return Cipher(algorithm, modes.CTR(_ENCRYPTION_IV))
+
+
+@lru_cache(maxsize=64)
+def _mreq_for(address: str) -> bytes:
+    """Return the multicast membership request for an interface address."""
+    return _MULTICAST_ADDR_BYTES + socket.inet_aton(address)
+
 
 class NetworkManager:
     """Network interface manager for discovering valid interfaces."""
 
     def get_valid_interfaces(self) -> List[Dict[str, Any]]:
         """Get all valid network interfaces for multicast communication."""
-        interfaces: List[Dict[str, Any]] = []
-        for interface_name, addrs in psutil.net_if_addrs().items():
-            for addr in addrs:
-                if addr.family == socket.AF_INET:
-                    ip = addr.address
-                    if self._is_valid_ip(ip):
-                        interfaces.append(
-                            self._create_interface_info(interface_name, ip)
-                        )
-        return interfaces
+        if_stats = psutil.net_if_stats()
+        return [
+            self._create_interface_info(interface_name, addr.address)
+            for interface_name, addrs in psutil.net_if_addrs().items()
+            if self._is_usable_interface(if_stats.get(interface_name))
+            for addr in addrs
+            if addr.family == socket.AF_INET and self._is_valid_ip(addr.address)
+        ]
+
+    def _is_usable_interface(self, stats: Any) -> bool:
+        """Check if interface is up and able to send multicast traffic."""
+        if stats is None or not stats.isup:
+            return False
+        # flags is empty on platforms where psutil cannot report it (e.g. Windows)
+        flags = set(filter(None, getattr(stats, "flags", "").split(",")))
+        return not flags or "multicast" in flags
 
     def _is_valid_ip(self, ip: str) -> bool:
         """Check if IP address is valid for multicast communication."""
-        if not ip or ip.startswith("127."):
+        if not ip or ip.startswith(("127.", "169.254.")) or ip == "0.0.0.0":
             return False
+        # Fast path for the common LAN ranges; anything else goes through ipaddress
+        if ip.count(".") == 3 and ip.startswith(("192.168.", "10.")):
+            return True
         ip_obj = ipaddress.IPv4Address(ip)
-        return not ip_obj.is_loopback and not ip_obj.is_link_local
+        return ip_obj.is_private and not ip_obj.is_loopback and not ip_obj.is_link_local
 
     def _create_interface_info(self, name: str, ip: str) -> Dict[str, Any]:
         """Create interface info dict."""
@@ -48,22 +80,21 @@ class MessageCryptor:
     """Message encryption and decryption handler"""
 
     SR_KEY: str = "SR-DALI-GW-HASYS"
-    ENCRYPTION_IV: bytes = b"0000000000101111"
+    ENCRYPTION_IV: bytes = _ENCRYPTION_IV
 
     def encrypt_data(self, data: str, key: str) -> str:
-        key_bytes = key.encode("utf-8")
-        cipher = Cipher(algorithms.AES(key_bytes), modes.CTR(self.ENCRYPTION_IV))
-        encryptor = cipher.encryptor()
+        encryptor = _cipher_for_key(key.encode("utf-8")).encryptor()
         encrypted_data = encryptor.update(data.encode("utf-8")) + encryptor.finalize()
         return encrypted_data.hex()
 
-    def decrypt_data(self, encrypted_hex: str, key: str) -> str:
-        key_bytes = key.encode("utf-8")
+    def decrypt_bytes(self, encrypted_hex: str, key: str) -> bytes:
+        """Decrypt hex-encoded data and return the raw plaintext bytes."""
         encrypted_bytes = bytes.fromhex(encrypted_hex)
-        cipher = Cipher(algorithms.AES(key_bytes), modes.CTR(self.ENCRYPTION_IV))
-        decryptor = cipher.decryptor()
-        decrypted_data = decryptor.update(encrypted_bytes) + decryptor.finalize()
-        return decrypted_data.decode("utf-8")
+        decryptor = _cipher_for_key(key.encode("utf-8")).decryptor()
+        return decryptor.update(encrypted_bytes) + decryptor.finalize()
+
+    def decrypt_data(self, encrypted_hex: str, key: str) -> str:
+        return self.decrypt_bytes(encrypted_hex, key).decode("utf-8")
 
     def random_key(self) -> str:
         return uuid.uuid4().hex[:16]
@@ -78,8 +109,7 @@ class MessageCryptor:
         if gw_sn is not None:
             message_dict = {**message_dict, "snList": [gw_sn]}
 
-        message_json = json.dumps(message_dict)
-        return message_json.encode("utf-8")
+        return json_dumps(message_dict)
 
     def prepare_identify_message(self, gw_sn: str, msg_id: str) -> bytes:
         """Prepare identify gateway message for UDP multicast.
@@ -102,16 +132,21 @@ class MessageCryptor:
             "gwSn": gw_sn,
         }
 
-        message_json = json.dumps(message_dict)
-        return message_json.encode("utf-8")
+        return json_dumps(message_dict)
 
 
 class MulticastSender:
     """Multicast communication manager"""
 
-    MULTICAST_ADDR: str = "239.255.255.250"
+    MULTICAST_ADDR: str = _MULTICAST_ADDR
     SEND_PORT: int = 1900
     LISTEN_PORT: int = 50569
+    # Preferred listen port, nine fallbacks, then any free port
+    _BIND_PORTS: Tuple[int, ...] = (*range(LISTEN_PORT, LISTEN_PORT + 10), 0)
+
+    def __init__(self) -> None:
+        # Single send socket, pointed at each interface via IP_MULTICAST_IF
+        self._send_sock: socket.socket | None = None
 
     def create_listener_socket(self, interfaces: List[Dict[str, Any]]) -> socket.socket:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -126,33 +161,36 @@ class MulticastSender:
     def cleanup_socket(
         self, sock: socket.socket, interfaces: List[Dict[str, Any]]
     ) -> None:
-        mreq_list = []
         for interface in interfaces:
-            mreq = socket.inet_aton(self.MULTICAST_ADDR) + socket.inet_aton(
-                interface["address"]
-            )
-            mreq_list.append(mreq)
-        for mreq in mreq_list:
+            mreq = _mreq_for(interface["address"])
             with contextlib.suppress(OSError):
                 sock.setsockopt(socket.IPPROTO_IP, socket.IP_DROP_MEMBERSHIP, mreq)
         sock.close()
+        self.close_send_sockets()
+
+    def close_send_sockets(self) -> None:
+        """Close the shared send socket."""
+        if self._send_sock is not None:
+            self._send_sock.close()
+            self._send_sock = None
 
     async def send_multicast_message(
         self, interfaces: List[Dict[str, Any]], message: bytes
     ) -> None:
-        tasks = [
-            asyncio.create_task(self._send_on_interface(interface, message))
-            for interface in interfaces
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Small UDP datagrams on a non-blocking socket complete immediately,
+        # so there is no need to fan the sends out into tasks
+        sock = self._get_send_socket()
+        for interface in interfaces:
+            address = interface["address"]
+            try:
+                sock.setsockopt(
+                    socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(address)
+                )
+                sock.sendto(message, (self.MULTICAST_ADDR, self.SEND_PORT))
+            except OSError as exc:
+                _LOGGER.debug("Multicast send via %s failed: %s", address, exc)
 
     def _bind_to_port(self, sock: socket.socket) -> None:
-        ports_to_try = [
-            self.LISTEN_PORT,
-            *range(self.LISTEN_PORT + 1, self.LISTEN_PORT + 10),
-            0,
-        ]
-
         def try_bind_port(port: int) -> bool:
             try:
                 sock.bind(("0.0.0.0", port))
@@ -161,7 +199,7 @@ class MulticastSender:
             else:
                 return True
 
-        for port in ports_to_try:
+        for port in self._BIND_PORTS:
             if try_bind_port(port):
                 return
 
@@ -172,26 +210,19 @@ class MulticastSender:
         self, sock: socket.socket, interfaces: List[Dict[str, Any]]
     ) -> None:
         for interface in interfaces:
-            mreq = socket.inet_aton(self.MULTICAST_ADDR) + socket.inet_aton(
-                interface["address"]
-            )
+            mreq = _mreq_for(interface["address"])
             with contextlib.suppress(OSError):
                 sock.setsockopt(socket.IPPROTO_IP, socket.IP_DROP_MEMBERSHIP, mreq)
 
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
-    async def _send_on_interface(
-        self, interface: Dict[str, Any], message: bytes
-    ) -> None:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+    def _get_send_socket(self) -> socket.socket:
+        if self._send_sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.bind((interface["address"], 0))
-            sock.setsockopt(
-                socket.IPPROTO_IP,
-                socket.IP_MULTICAST_IF,
-                socket.inet_aton(interface["address"]),
-            )
-            sock.sendto(message, (self.MULTICAST_ADDR, self.SEND_PORT))
+            sock.setblocking(False)
+            self._send_sock = sock
+        return self._send_sock
 
 
 async def send_identify_gateway(gw_sn: str) -> None:
@@ -215,4 +246,7 @@ async def send_identify_gateway(gw_sn: str) -> None:
     msg_id = str(int(time.time()))
     message = cryptor.prepare_identify_message(gw_sn, msg_id)
 
-    await sender.send_multicast_message(interfaces, message)
+    try:
+        await sender.send_multicast_message(interfaces, message)
+    finally:
+        sender.close_send_sockets()
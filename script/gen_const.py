@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Generate the device model/type lookup tables for PySrDaliGateway/const.py.
+
+The motion sensor variants (020101-020120) are expanded here so const.py can
+hold plain dict literals instead of building them at import time.
+
+Usage:
+    python script/gen_const.py
+
+Paste the printed block over the generated section in const.py, then run
+``ruff format``.
+"""
+
+from typing import Dict
+
+BASE_DEVICE_MODEL_MAP: Dict[str, str] = {
+    "0101": "DALI DT6 Dimmable Driver",
+    "0102": "DALI DT8 Tc Dimmable Driver",
+    "0103": "DALI DT8 RGB Dimmable Driver",
+    "0104": "DALI DT8 XY Dimmable Driver",
+    "0105": "DALI DT8 RGBW Dimmable Driver",
+    "0106": "DALI DT8 RGBWA Dimmable Driver",
+    "0201": "DALI-2 Motion Sensor",
+    "0202": "DALI-2 Illuminance Sensor",
+    "0302": "DALI-2 2-Key Push Button Panel",
+    "0304": "DALI-2 4-Key Push Button Panel",
+    "0306": "DALI-2 6-Key Push Button Panel",
+    "0308": "DALI-2 8-Key Push Button Panel",
+}
+
+BASE_DEVICE_TYPE_MAP: Dict[str, str] = {
+    "0101": "Dimmer",
+    "0102": "CCT",
+    "0103": "RGB",
+    "0104": "XY",
+    "0105": "RGBW",
+    "0106": "RGBWA",
+    "0201": "Motion",
+    "0202": "Illuminance",
+    "0302": "2-Key Panel",
+    "0304": "4-Key Panel",
+    "0306": "6-Key Panel",
+    "0308": "8-Key Panel",
+}
+
+MOTION_VARIANTS = range(1, 21)
+
+
+def build_device_model_map() -> Dict[str, str]:
+    variants = {f"0201{i:02d}": "DALI-2 Motion Sensor" for i in MOTION_VARIANTS}
+    return {**BASE_DEVICE_MODEL_MAP, **variants}
+
+
+def build_device_type_map() -> Dict[str, str]:
+    variants = {f"0201{i:02d}": f"Motion ({i})" for i in MOTION_VARIANTS}
+    return {**BASE_DEVICE_TYPE_MAP, **variants}
+
+
+def render(name: str, mapping: Dict[str, str]) -> str:
+    lines = [f"{name}: dict[str, str] = {{"]
+    lines.extend(f'    "{key}": "{value}",' for key, value in mapping.items())
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    print("# --- Generated by script/gen_const.py, do not edit by hand ---")
+    print("# Includes motion sensor variants 020101-020120")
+    print(render("DEVICE_MODEL_MAP", build_device_model_map()))
+    print()
+    print("# Human-readable device type names")
+    print(render("DEVICE_TYPE_MAP", build_device_type_map()))
+    print("# --- End generated ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,35 @@
 #!/usr/bin/env python3
 """Gateway credential caching for test scripts."""
 
-import base64
+from binascii import a2b_base64, b2a_base64
 from datetime import datetime, timezone
 import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from PySrDaliGateway.device import Device
 from PySrDaliGateway.gateway import DaliGateway
+from PySrDaliGateway.group import Group
+from PySrDaliGateway.helper import json_dumps, json_loads
+from PySrDaliGateway.scene import Scene
 
 _LOGGER = logging.getLogger(__name__)
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
 
 class GatewayCredentialCache:
     """Manages persistent storage of gateway credentials for testing."""
 
     CACHE_VERSION = 1
     CACHE_FILE = Path(__file__).parent / ".gateway_cache.json"
+    # base64 adds no protection over the 0o600 file mode, so credentials are
+    # stored as-is; set True to write base64 like older caches
+    OBFUSCATE = False
+    # Cached devices/groups/scenes older than this are rediscovered
+    TOPOLOGY_MAX_AGE = 24 * 60 * 60  # seconds
 
     def __init__(self) -> None:
         """Initialize cache and load existing data."""
@@ -39,19 +50,26 @@ class GatewayCredentialCache:
         Args:
             gateway: DaliGateway instance with connection info
         """
+        username, passwd = gateway.username, gateway.passwd
+        if self.OBFUSCATE:
+            username = self._encode_credential(username)
+            passwd = self._encode_credential(passwd)
+
         gw_data: dict[str, Any] = {
             "gw_sn": gateway.gw_sn,
             "gw_ip": gateway.gw_ip,
             "port": gateway.port,
-            "username": self._encode_credential(gateway.username),
-            "passwd": self._encode_credential(gateway.passwd),
+            "username": username,
+            "passwd": passwd,
+            "obfuscated": self.OBFUSCATE,
             "name": gateway.name,
             "is_tls": gateway.is_tls,
-            "channel_total": list(gateway.channel_total),
+            "channel_total": gateway.channel_total,
             "last_connection": datetime.now(timezone.utc).isoformat(),
         }
 
         self._cache_data["gateways"][gateway.gw_sn] = gw_data
+        self._cache_data["last_gw_sn"] = gateway.gw_sn
         self._save_cache()
         _LOGGER.debug("Saved gateway %s to cache", gateway.gw_sn)
 
@@ -64,27 +82,139 @@ class GatewayCredentialCache:
         if not self.has_cache():
             return None
 
-        # Find gateway with most recent last_connection timestamp
         gateways = self._cache_data["gateways"]
-        last_gw_sn = max(
-            gateways.keys(),
-            key=lambda sn: gateways[sn].get("last_connection", ""),
-        )
-
-        gw_data = gateways[last_gw_sn]
+        gw_data = gateways.get(self._cache_data.get("last_gw_sn"))
+        if gw_data is None:
+            # Caches written before last_gw_sn was tracked: use the most
+            # recent last_connection timestamp
+            gw_data = max(
+                gateways.values(),
+                key=lambda data: data.get("last_connection", ""),
+            )
+
+        # Entries written before the flag existed are always base64
+        username, passwd = gw_data["username"], gw_data["passwd"]
+        if gw_data.get("obfuscated", True):
+            username = self._decode_credential(username)
+            passwd = self._decode_credential(passwd)
 
-        # Decode credentials and return
         return {
             "gw_sn": gw_data["gw_sn"],
             "gw_ip": gw_data["gw_ip"],
             "port": gw_data["port"],
-            "username": self._decode_credential(gw_data["username"]),
-            "passwd": self._decode_credential(gw_data["passwd"]),
+            "username": username,
+            "passwd": passwd,
             "name": gw_data.get("name"),
             "is_tls": gw_data.get("is_tls", False),
             "channel_total": gw_data.get("channel_total", [0]),
         }
 
+    def save_topology(
+        self,
+        gw_sn: str,
+        *,
+        devices: Optional[Iterable[Device]] = None,
+        groups: Optional[Iterable[Group]] = None,
+        scenes: Optional[Iterable[Scene]] = None,
+    ) -> None:
+        """Save discovered devices, groups and/or scenes for a gateway.
+
+        Only the kinds passed in are replaced; the others keep their
+        previous snapshot.
+
+        Args:
+            gw_sn: Gateway serial number
+            devices: Discovered devices
+            groups: Discovered groups
+            scenes: Discovered scenes
+        """
+        topology = self._cache_data.setdefault("topology", {}).setdefault(gw_sn, {})
+        saved_at = datetime.now(timezone.utc).isoformat()
+
+        if devices is not None:
+            # Stored in the searchDevRes shape so the gateway parser can
+            # rebuild them
+            topology["devices"] = {
+                "saved_at": saved_at,
+                "items": [
+                    {
+                        "devId": device.dev_id,
+                        "name": device.name,
+                        "devType": device.dev_type,
+                        "channel": device.channel,
+                        "address": device.address,
+                        "status": device.status,
+                        "devSn": device.dev_sn,
+                        "areaName": device.area_name,
+                        "areaId": device.area_id,
+                    }
+                    for device in devices
+                ],
+            }
+        if groups is not None:
+            topology["groups"] = {
+                "saved_at": saved_at,
+                "items": [
+                    {
+                        "group_id": group.group_id,
+                        "name": group.name,
+                        "channel": group.channel,
+                        "area_id": group.area_id,
+                        "devices": group.devices,
+                    }
+                    for group in groups
+                ],
+            }
+        if scenes is not None:
+            topology["scenes"] = {
+                "saved_at": saved_at,
+                "items": [
+                    {
+                        "scene_id": scene.scene_id,
+                        "name": scene.name,
+                        "channel": scene.channel,
+                        "area_id": scene.area_id,
+                        "devices": scene.devices,
+                    }
+                    for scene in scenes
+                ],
+            }
+
+        self._save_cache()
+        _LOGGER.debug("Saved topology for gateway %s to cache", gw_sn)
+
+    def load_topology(
+        self, gw_sn: str, kind: str, max_age: Optional[float] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Retrieve a cached topology snapshot for a gateway.
+
+        Args:
+            gw_sn: Gateway serial number
+            kind: One of "devices", "groups" or "scenes"
+            max_age: Maximum snapshot age in seconds (default TOPOLOGY_MAX_AGE)
+
+        Returns:
+            List of cached entries, or None if missing or stale
+        """
+        snapshot = self._cache_data.get("topology", {}).get(gw_sn, {}).get(kind)
+        if snapshot is None:
+            return None
+
+        if max_age is None:
+            max_age = self.TOPOLOGY_MAX_AGE
+        try:
+            saved_at = datetime.fromisoformat(snapshot["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        age = (datetime.now(timezone.utc) - saved_at).total_seconds()
+        if age > max_age:
+            _LOGGER.debug(
+                "Cached %s for gateway %s expired (%.0fs old)", kind, gw_sn, age
+            )
+            return None
+
+        return snapshot["items"]
+
     def _get_empty_cache(self) -> Dict[str, Any]:
         """Get empty cache structure.
 
@@ -94,15 +224,16 @@ class GatewayCredentialCache:
         return {
             "version": self.CACHE_VERSION,
             "last_updated": None,
+            "last_gw_sn": None,
             "gateways": {},
+            "topology": {},
         }
 
     def _load_cache(self) -> None:
         """Load cache from disk with error handling."""
         try:
             if self.CACHE_FILE.exists():
-                with self.CACHE_FILE.open() as f:
-                    data = json.load(f)
+                data = json_loads(self.CACHE_FILE.read_bytes())
 
                 # Validate version
                 if data.get("version") != self.CACHE_VERSION:
@@ -124,18 +255,20 @@ class GatewayCredentialCache:
             # Update timestamp
             self._cache_data["last_updated"] = datetime.now(timezone.utc).isoformat()
 
-            # Atomic write pattern: write to temp file, then rename
+            # Atomic write pattern: write to temp file, then rename. The temp
+            # file is created 0o600 so credentials are never world-readable.
             temp_file = self.CACHE_FILE.with_suffix(".json.tmp")
-            with temp_file.open("w") as f:
-                json.dump(self._cache_data, f, indent=2)
+            fd = os.open(temp_file, _WRITE_FLAGS, 0o600)
+            if hasattr(os, "fchmod"):
+                # The mode above only applies on creation; a stale temp file
+                # left by an older run keeps its old, possibly wider, mode
+                os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_dumps(self._cache_data))
 
             # Replace original file atomically
             temp_file.replace(self.CACHE_FILE)
 
-            # Set restrictive permissions (Unix only)
-            if hasattr(os, "chmod"):
-                self.CACHE_FILE.chmod(0o600)
-
             _LOGGER.debug("Cache saved successfully")
 
         except OSError as e:
@@ -150,7 +283,7 @@ class GatewayCredentialCache:
         Returns:
             Base64 encoded string
         """
-        return base64.b64encode(value.encode("utf-8")).decode("utf-8")
+        return b2a_base64(value.encode("utf-8"), newline=False).decode("ascii")
 
     def _decode_credential(self, value: str) -> str:
         """Decode credential from base64.
@@ -161,4 +294,4 @@ class GatewayCredentialCache:
         Returns:
             Decoded credential string
         """
-        return base64.b64decode(value.encode("utf-8")).decode("utf-8")
+        return a2b_base64(value).decode("utf-8")
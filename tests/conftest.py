@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures for DALI Gateway hardware testing."""
 
 import asyncio
+from collections import defaultdict
 import json
 import logging
 import time
@@ -53,6 +54,11 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     group.addoption(
         "--device-limit", type=int, help="Limit number of devices for testing"
     )
+    group.addoption(
+        "--use-cached-topology",
+        action="store_true",
+        help="Reuse cached devices/groups/scenes instead of rediscovering them",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -183,10 +189,12 @@ async def connected_gateway(
 
     _LOGGER.info("Connected to gateway successfully")
 
-    # Save credentials to cache after successful connection
+    # Save credentials to cache after successful connection; the cache is a
+    # disk write, so keep it off the event loop
     if gateway.username and gateway.passwd:
-        cache = GatewayCredentialCache()
-        cache.save_gateway(gateway)
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: GatewayCredentialCache().save_gateway(gateway)
+        )
 
     yield gateway
 
@@ -198,27 +206,83 @@ async def connected_gateway(
         _LOGGER.warning("Error during gateway disconnect", exc_info=True)
 
 
+async def _load_cached_topology(
+    request: pytest.FixtureRequest, gw_sn: str, kind: str
+) -> List[Dict[str, Any]] | None:
+    """Return cached topology entries if --use-cached-topology is set and fresh."""
+    if not request.config.getoption("--use-cached-topology"):
+        return None
+    cached = await asyncio.get_running_loop().run_in_executor(
+        None, lambda: GatewayCredentialCache().load_topology(gw_sn, kind)
+    )
+    if cached:
+        _LOGGER.info("Using %d cached %s for gateway %s", len(cached), kind, gw_sn)
+    return cached or None
+
+
+# Each kind has its own fixture so tests only wait for the discovery they
+# use. pytest sets fixtures up one at a time, so the group and scene reads
+# (each capped at MAX_CONCURRENT_READS) never run together.
 @pytest.fixture(scope="session")
-async def discovered_devices(connected_gateway: TestDaliGateway) -> List[Device]:
+async def discovered_devices(
+    request: pytest.FixtureRequest, connected_gateway: TestDaliGateway
+) -> List[Device]:
     """Discover devices on the connected gateway."""
+    gw_sn = connected_gateway.gw_sn
+    cached = await _load_cached_topology(request, gw_sn, "devices")
+    if cached is not None:
+        return [connected_gateway._parse_device_from_raw(raw) for raw in cached]
+
     devices = await connected_gateway.discover_devices()
     _LOGGER.info("Discovered %d device(s)", len(devices))
+    await asyncio.get_running_loop().run_in_executor(
+        None, lambda: GatewayCredentialCache().save_topology(gw_sn, devices=devices)
+    )
     return devices
 
 
 @pytest.fixture(scope="session")
-async def discovered_groups(connected_gateway: TestDaliGateway) -> List[Group]:
+def devices_by_type_prefix(discovered_devices: List[Device]) -> Dict[str, List[Device]]:
+    """Index discovered devices by dev_type category ("01" lights, "02" sensors)."""
+    index: Dict[str, List[Device]] = defaultdict(list)
+    for device in discovered_devices:
+        index[device.dev_type[:2]].append(device)
+    return dict(index)
+
+
+@pytest.fixture(scope="session")
+async def discovered_groups(
+    request: pytest.FixtureRequest, connected_gateway: TestDaliGateway
+) -> List[Group]:
     """Discover groups on the connected gateway."""
+    gw_sn = connected_gateway.gw_sn
+    cached = await _load_cached_topology(request, gw_sn, "groups")
+    if cached is not None:
+        return [Group(connected_gateway, **data) for data in cached]
+
     groups = await connected_gateway.discover_groups()
     _LOGGER.info("Discovered %d group(s)", len(groups))
+    await asyncio.get_running_loop().run_in_executor(
+        None, lambda: GatewayCredentialCache().save_topology(gw_sn, groups=groups)
+    )
     return groups
 
 
 @pytest.fixture(scope="session")
-async def discovered_scenes(connected_gateway: TestDaliGateway) -> List[Scene]:
+async def discovered_scenes(
+    request: pytest.FixtureRequest, connected_gateway: TestDaliGateway
+) -> List[Scene]:
     """Discover scenes on the connected gateway."""
+    gw_sn = connected_gateway.gw_sn
+    cached = await _load_cached_topology(request, gw_sn, "scenes")
+    if cached is not None:
+        return [Scene(connected_gateway, **data) for data in cached]
+
     scenes = await connected_gateway.discover_scenes()
     _LOGGER.info("Discovered %d scene(s)", len(scenes))
+    await asyncio.get_running_loop().run_in_executor(
+        None, lambda: GatewayCredentialCache().save_topology(gw_sn, scenes=scenes)
+    )
     return scenes
 
 
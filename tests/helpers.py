@@ -23,9 +23,18 @@ class IdentifyResponseListener:
     def __init__(self, gw_sn: str):
         self.gw_sn = gw_sn
         self._response_received = asyncio.Event()
+        self._ready = asyncio.Event()
         self._ack: bool = False
         self._listen_sock: socket.socket | None = None
 
+    async def wait_until_listening(self) -> None:
+        """Wait until wait_for_response() has bound its socket or given up.
+
+        Send the identify request after this returns so the response cannot
+        arrive before the listener exists.
+        """
+        await self._ready.wait()
+
     async def wait_for_response(self, timeout: float = 5.0) -> bool:
         """Wait for identify response via UDP.
 
@@ -55,10 +64,14 @@ class IdentifyResponseListener:
 
         if not interfaces:
             _LOGGER.warning("No network interfaces for listening")
+            self._ready.set()
             return False
 
         # Create listener socket
-        self._listen_sock = sender.create_listener_socket(interfaces)
+        try:
+            self._listen_sock = sender.create_listener_socket(interfaces)
+        finally:
+            self._ready.set()
 
         try:
             # Wait for response with timeout
@@ -188,11 +201,17 @@ class TestDaliGateway(DaliGateway):
 def make_light_callback(
     device_id: str,
     events: List[Tuple[str, LightStatus]],
+    arrived: asyncio.Event | None = None,
 ):
-    """Create a light status callback that appends to *events*."""
+    """Create a light status callback that appends to *events*.
+
+    If *arrived* is given it is set on every update.
+    """
 
     def on_light_status(status: LightStatus) -> None:
         events.append((device_id, status))
+        if arrived is not None:
+            arrived.set()
         _LOGGER.info("Light status: %s -> %s", device_id, status)
 
     return on_light_status
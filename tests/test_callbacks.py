@@ -5,7 +5,12 @@ import logging
 from typing import List, Tuple
 
 from PySrDaliGateway.device import Device
-from PySrDaliGateway.helper import is_light_device
+from PySrDaliGateway.helper import (
+    is_illuminance_sensor,
+    is_light_device,
+    is_motion_sensor,
+    is_panel_device,
+)
 from PySrDaliGateway.types import (
     CallbackEventType,
     IlluminanceStatus,
@@ -28,11 +33,14 @@ _LOGGER = logging.getLogger(__name__)
 def _make_motion_callback(
     device_id: str,
     events: List[Tuple[str, MotionStatus]],
+    arrived: asyncio.Event | None = None,
 ):
     """Create a motion status callback that appends to *events*."""
 
     def on_motion_status(status: MotionStatus) -> None:
         events.append((device_id, status))
+        if arrived is not None:
+            arrived.set()
         _LOGGER.info("Motion status: %s -> %s", device_id, status)
 
     return on_motion_status
@@ -41,11 +49,14 @@ def _make_motion_callback(
 def _make_illuminance_callback(
     device_id: str,
     events: List[Tuple[str, IlluminanceStatus]],
+    arrived: asyncio.Event | None = None,
 ):
     """Create an illuminance status callback that appends to *events*."""
 
     def on_illuminance_status(status: IlluminanceStatus) -> None:
         events.append((device_id, status))
+        if arrived is not None:
+            arrived.set()
         _LOGGER.info(
             "Illuminance status: %s -> %s lux (valid: %s)",
             device_id,
@@ -59,11 +70,14 @@ def _make_illuminance_callback(
 def _make_panel_callback(
     device_id: str,
     events: List[Tuple[str, PanelStatus]],
+    arrived: asyncio.Event | None = None,
 ):
     """Create a panel status callback that appends to *events*."""
 
     def on_panel_status(status: PanelStatus) -> None:
         events.append((device_id, status))
+        if arrived is not None:
+            arrived.set()
         event_type = status["event_type"]
         rotate_info = ""
         if event_type == PanelEventType.ROTATE:
@@ -79,6 +93,19 @@ def _make_panel_callback(
     return on_panel_status
 
 
+def _log_registered(label: str, device: Device) -> None:
+    """Log a device whose status listener was just registered."""
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "Registered %s device: %s (Channel %s, Address %s, Model: %s)",
+            label,
+            device.name,
+            device.channel,
+            device.address,
+            device.model or "N/A",
+        )
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -99,13 +126,25 @@ async def test_callback_setup(
     illuminance_status_events: List[Tuple[str, IlluminanceStatus]] = []
     panel_status_events: List[Tuple[str, PanelStatus]] = []
 
-    # Classify devices by type
-    light_devices = [d for d in discovered_devices if is_light_device(d.dev_type)]
-    motion_devices = [d for d in discovered_devices if d.dev_type == "0201"]
-    illuminance_devices = [d for d in discovered_devices if d.dev_type == "0301"]
-    panel_devices = [
-        d for d in discovered_devices if d.dev_type in ["0401", "0402", "0403", "0404"]
-    ]
+    # Classify devices by type in one pass
+    light_devices: List[Device] = []
+    motion_devices: List[Device] = []
+    illuminance_devices: List[Device] = []
+    panel_devices: List[Device] = []
+    for device in discovered_devices:
+        dev_type = device.dev_type
+        if is_light_device(dev_type):
+            light_devices.append(device)
+        elif is_motion_sensor(dev_type):
+            motion_devices.append(device)
+        elif is_illuminance_sensor(dev_type):
+            illuminance_devices.append(device)
+        elif is_panel_device(dev_type):
+            panel_devices.append(device)
+
+    # Devices to read and the event each one's callback sets; listeners are
+    # all registered first, then the reads go out in one pass
+    pending_reads: List[Tuple[Device, asyncio.Event]] = []
 
     _LOGGER.info(
         "Found devices - Light: %d, Motion: %d, Illuminance: %d, Panel: %d",
@@ -119,91 +158,69 @@ async def test_callback_setup(
     if light_devices:
         _LOGGER.info("Testing light device callbacks...")
         for device in light_devices[:3]:
+            arrived = asyncio.Event()
             device.register_listener(
                 CallbackEventType.LIGHT_STATUS,
-                make_light_callback(device.dev_id, light_status_events),
-            )
-            model_info = device.model or "N/A"
-            _LOGGER.info(
-                "Reading light device: %s (Channel %s, Address %s, Model: %s)",
-                device.name,
-                device.channel,
-                device.address,
-                model_info,
-            )
-            connected_gateway.command_read_dev(
-                device.dev_type, device.channel, device.address
+                make_light_callback(device.dev_id, light_status_events, arrived),
             )
-            await asyncio.sleep(2)
+            _log_registered("light", device)
+            pending_reads.append((device, arrived))
 
     # Test motion devices
     if motion_devices:
         _LOGGER.info("Testing motion sensor callbacks...")
         for device in motion_devices[:2]:
+            arrived = asyncio.Event()
             device.register_listener(
                 CallbackEventType.MOTION_STATUS,
-                _make_motion_callback(device.dev_id, motion_status_events),
+                _make_motion_callback(device.dev_id, motion_status_events, arrived),
             )
-            model_info = device.model or "N/A"
-            _LOGGER.info(
-                "Reading motion device: %s (Channel %s, Address %s, Model: %s)",
-                device.name,
-                device.channel,
-                device.address,
-                model_info,
-            )
-            connected_gateway.command_read_dev(
-                device.dev_type, device.channel, device.address
-            )
-            await asyncio.sleep(2)
+            _log_registered("motion", device)
+            pending_reads.append((device, arrived))
 
     # Test illuminance devices
     if illuminance_devices:
         _LOGGER.info("Testing illuminance sensor callbacks...")
         for device in illuminance_devices[:2]:
+            arrived = asyncio.Event()
             device.register_listener(
                 CallbackEventType.ILLUMINANCE_STATUS,
-                _make_illuminance_callback(device.dev_id, illuminance_status_events),
-            )
-            model_info = device.model or "N/A"
-            _LOGGER.info(
-                "Reading illuminance device: %s (Channel %s, Address %s, Model: %s)",
-                device.name,
-                device.channel,
-                device.address,
-                model_info,
-            )
-            connected_gateway.command_read_dev(
-                device.dev_type, device.channel, device.address
+                _make_illuminance_callback(
+                    device.dev_id, illuminance_status_events, arrived
+                ),
             )
-            await asyncio.sleep(2)
+            _log_registered("illuminance", device)
+            pending_reads.append((device, arrived))
 
     # Test panel devices
     if panel_devices:
         _LOGGER.info("Testing panel callbacks...")
         for device in panel_devices[:2]:
+            arrived = asyncio.Event()
             device.register_listener(
                 CallbackEventType.PANEL_STATUS,
-                _make_panel_callback(device.dev_id, panel_status_events),
+                _make_panel_callback(device.dev_id, panel_status_events, arrived),
             )
-            model_info = device.model or "N/A"
-            _LOGGER.info(
-                "Reading panel device: %s (Channel %s, Address %s, Model: %s)",
-                device.name,
-                device.channel,
-                device.address,
-                model_info,
-            )
-            connected_gateway.command_read_dev(
-                device.dev_type, device.channel, device.address
-            )
-            await asyncio.sleep(2)
+            _log_registered("panel", device)
+            pending_reads.append((device, arrived))
 
     _LOGGER.info("All device callbacks registered successfully")
 
-    # Wait for delayed responses
-    _LOGGER.info("Waiting 5 seconds for final responses...")
-    await asyncio.sleep(5)
+    read_dev = connected_gateway.command_read_dev
+    for device, _ in pending_reads:
+        read_dev(device.dev_type, device.channel, device.address)
+
+    # The reads are independent, so wait for all responses at once
+    _LOGGER.info("Waiting up to 5 seconds for %d response(s)...", len(pending_reads))
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(arrived.wait(), timeout=5.0)
+            for _, arrived in pending_reads
+        ),
+        return_exceptions=True,
+    )
+    answered = sum(not isinstance(result, BaseException) for result in results)
+    _LOGGER.info("%d/%d device(s) answered ReadDev", answered, len(results))
 
     # Report
     total_events = (
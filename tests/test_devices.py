@@ -5,12 +5,12 @@ Migrated from script/test_cases.py to pytest.
 
 import asyncio
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Sized, Tuple
 
 import pytest
 
 from PySrDaliGateway.device import Device
-from PySrDaliGateway.helper import is_cct_device, is_light_device, is_sensor_device
+from PySrDaliGateway.helper import is_cct_device, is_light_device
 from PySrDaliGateway.types import CallbackEventType, DeviceParamType, SensorParamType
 
 from .helpers import TestDaliGateway
@@ -23,41 +23,61 @@ _LOGGER = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def _make_dev_param_callback(events: List[Tuple[str, DeviceParamType]], device_id: str):
-    """Create a device parameter callback that appends to *events*."""
+def _make_dev_param_callback(
+    events: List[Tuple[str, DeviceParamType]],
+    device_id: str,
+    arrived: asyncio.Event,
+):
+    """Create a device parameter callback that appends to *events*.
+
+    *arrived* is set on every update so waiters wake up without polling.
+    """
 
     def on_dev_param(params: DeviceParamType) -> None:
         events.append((device_id, params))
+        arrived.set()
         _LOGGER.info("Device parameters: %s -> %s", device_id, params)
 
     return on_dev_param
 
 
 def _make_sensor_param_callback(
-    events: List[Tuple[str, SensorParamType]], device_id: str
+    events: List[Tuple[str, SensorParamType]],
+    device_id: str,
+    arrived: asyncio.Event,
 ):
-    """Create a sensor parameter callback that appends to *events*."""
+    """Create a sensor parameter callback that appends to *events*.
+
+    *arrived* is set on every update so waiters wake up without polling.
+    """
 
     def on_sensor_param(params: SensorParamType) -> None:
         events.append((device_id, params))
+        arrived.set()
         _LOGGER.info("Sensor parameters: %s -> %s", device_id, params)
 
     return on_sensor_param
 
 
-async def _await_dev_param(
-    events: List[Tuple[str, DeviceParamType]],
+async def _await_param_event(
+    events: Sized,
     baseline_count: int,
+    arrived: asyncio.Event,
     timeout: float,
 ) -> bool:
-    """Wait for a new device parameter event up to *timeout* seconds."""
+    """Wait for *events* to grow past *baseline_count* up to *timeout* seconds."""
     loop = asyncio.get_running_loop()
-    start = loop.time()
-    while loop.time() - start < timeout:
-        if len(events) > baseline_count:
-            return True
-        await asyncio.sleep(0.5)
-    return False
+    deadline = loop.time() + timeout
+    while len(events) <= baseline_count:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        arrived.clear()
+        try:
+            await asyncio.wait_for(arrived.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            return len(events) > baseline_count
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -76,15 +96,16 @@ async def test_device_discovery(
     assert len(discovered_devices) > 0, "Device discovery returned no devices"
     _LOGGER.info("Found %d device(s)", len(discovered_devices))
 
-    for device in discovered_devices[:5]:  # Show first 5 devices
-        model_info = device.model or "N/A"
+    if _LOGGER.isEnabledFor(logging.INFO):
+        # One log record for the listing instead of one per device
         _LOGGER.info(
-            "  Device: %s (%s) - Channel %s, Address %s, Model: %s",
-            device.name,
-            device.dev_type,
-            device.channel,
-            device.address,
-            model_info,
+            "First devices:\n%s",
+            "\n".join(
+                f"  Device: {device.name} ({device.dev_type}) - "
+                f"Channel {device.channel}, Address {device.address}, "
+                f"Model: {device.model or 'N/A'}"
+                for device in discovered_devices[:5]
+            ),
         )
 
 
@@ -104,6 +125,7 @@ async def test_read_dev(
     if device_limit:
         devices_to_test = discovered_devices[:device_limit]
 
+    read_dev = connected_gateway.command_read_dev
     for device in devices_to_test:
         model_info = device.model or "N/A"
         _LOGGER.info(
@@ -113,9 +135,7 @@ async def test_read_dev(
             device.address,
             model_info,
         )
-        connected_gateway.command_read_dev(
-            device.dev_type, device.channel, device.address
-        )
+        read_dev(device.dev_type, device.channel, device.address)
 
     _LOGGER.info("ReadDev commands sent for %d devices", len(devices_to_test))
 
@@ -123,7 +143,7 @@ async def test_read_dev(
 @pytest.mark.asyncio
 async def test_set_dev_param(
     connected_gateway: TestDaliGateway,
-    discovered_devices: List[Device],
+    devices_by_type_prefix: Dict[str, List[Device]],
 ) -> None:
     """Set device parameters (fade time, fade rate, brightness limits) on a light."""
     interval = 5  # seconds
@@ -131,9 +151,7 @@ async def test_set_dev_param(
     _LOGGER.info("=== Testing Device Parameter Configuration ===")
 
     # Find a light device to test
-    light_device = next(
-        (d for d in discovered_devices if is_light_device(d.dev_type)), None
-    )
+    light_device = next(iter(devices_by_type_prefix.get("01", ())), None)
     assert light_device is not None, "No light device found for parameter testing"
 
     _LOGGER.info(
@@ -145,11 +163,14 @@ async def test_set_dev_param(
     )
 
     dev_param_events: List[Tuple[str, DeviceParamType]] = []
+    dev_param_arrived = asyncio.Event()
 
     # Register callback for parameter updates
     unsub = light_device.register_listener(
         CallbackEventType.DEV_PARAM,
-        _make_dev_param_callback(dev_param_events, light_device.dev_id),
+        _make_dev_param_callback(
+            dev_param_events, light_device.dev_id, dev_param_arrived
+        ),
     )
 
     try:
@@ -158,8 +179,8 @@ async def test_set_dev_param(
         light_device.get_device_parameters()
 
         baseline_events = len(dev_param_events)
-        got_initial_params = await _await_dev_param(
-            dev_param_events, baseline_events, timeout=12.0
+        got_initial_params = await _await_param_event(
+            dev_param_events, baseline_events, dev_param_arrived, timeout=12.0
         )
 
         if got_initial_params:
@@ -167,40 +188,30 @@ async def test_set_dev_param(
         else:
             _LOGGER.warning("No parameters received")
 
-        # Test 2: Set fade time and fade rate
-        _LOGGER.info("--- Test 2: Set fade time and fade rate ---")
+        # Test 2: Set fade and brightness limits in one setDevParam
+        _LOGGER.info("--- Test 2: Set fade time/rate and brightness limits ---")
         params: DeviceParamType = {
             "fade_time": 5,
             "fade_rate": 7,
-        }
-        _LOGGER.info("Setting parameters: %s", params)
-
-        dev_param_events.clear()
-        light_device.set_device_parameters(params)
-
-        await asyncio.sleep(interval)
-        _LOGGER.info("Fade parameters sent")
-
-        # Test 3: Set brightness limits
-        _LOGGER.info("--- Test 3: Set brightness limits ---")
-        params = {
             "min_brightness": 100,
             "max_brightness": 900,
         }
         _LOGGER.info("Setting parameters: %s", params)
         light_device.set_device_parameters(params)
 
+        # The gateway applies DALI writes asynchronously; let them settle
+        # before Test 3 reads them back
         await asyncio.sleep(interval)
-        _LOGGER.info("Brightness limits sent")
+        _LOGGER.info("Fade and brightness parameters sent")
 
-        # Test 4: Verify updated parameters
-        _LOGGER.info("--- Test 4: Verify updated parameters ---")
+        # Test 3: Verify updated parameters
+        _LOGGER.info("--- Test 3: Verify updated parameters ---")
         dev_param_events.clear()
         light_device.get_device_parameters()
 
         baseline_events = len(dev_param_events)
-        got_verified_params = await _await_dev_param(
-            dev_param_events, baseline_events, timeout=15.0
+        got_verified_params = await _await_param_event(
+            dev_param_events, baseline_events, dev_param_arrived, timeout=15.0
         )
 
         assert got_verified_params, (
@@ -215,8 +226,8 @@ async def test_set_dev_param(
         )
         _LOGGER.info("Parameters updated successfully")
 
-        # Test 5: Reset to defaults using broadcast
-        _LOGGER.info("--- Test 5: Reset to defaults using broadcast ---")
+        # Test 4: Reset to defaults using broadcast
+        _LOGGER.info("--- Test 4: Reset to defaults using broadcast ---")
         reset_params: DeviceParamType = {"max_brightness": 1000}
         connected_gateway.command_set_dev_param("FFFF", 0, 1, reset_params)
 
@@ -254,6 +265,7 @@ async def test_read_cct_range(
         pytest.skip("No CCT devices available")
 
     dev_param_events: List[Tuple[str, DeviceParamType]] = []
+    dev_param_arrived = asyncio.Event()
 
     # Test 1: CCT devices should return cct_cool and cct_warm (limit to 3)
     _LOGGER.info("--- Test 1: Read CCT range from CCT devices (up to 3) ---")
@@ -261,12 +273,16 @@ async def test_read_cct_range(
         dev_param_events.clear()
         unsub = device.register_listener(
             CallbackEventType.DEV_PARAM,
-            _make_dev_param_callback(dev_param_events, device.dev_id),
+            _make_dev_param_callback(
+                dev_param_events, device.dev_id, dev_param_arrived
+            ),
         )
         device.get_device_parameters()
 
         baseline = len(dev_param_events)
-        got_params = await _await_dev_param(dev_param_events, baseline, timeout=12.0)
+        got_params = await _await_param_event(
+            dev_param_events, baseline, dev_param_arrived, timeout=12.0
+        )
         unsub()
 
         assert got_params, f"No parameters received for CCT device {device.name}"
@@ -309,12 +325,16 @@ async def test_read_cct_range(
         dev_param_events.clear()
         unsub = test_device.register_listener(
             CallbackEventType.DEV_PARAM,
-            _make_dev_param_callback(dev_param_events, test_device.dev_id),
+            _make_dev_param_callback(
+                dev_param_events, test_device.dev_id, dev_param_arrived
+            ),
         )
         test_device.get_device_parameters()
 
         baseline = len(dev_param_events)
-        got_params = await _await_dev_param(dev_param_events, baseline, timeout=12.0)
+        got_params = await _await_param_event(
+            dev_param_events, baseline, dev_param_arrived, timeout=12.0
+        )
         unsub()
 
         if got_params:
@@ -345,17 +365,15 @@ async def test_read_cct_range(
 @pytest.mark.asyncio
 async def test_set_sensor_param(
     connected_gateway: TestDaliGateway,
-    discovered_devices: List[Device],
+    devices_by_type_prefix: Dict[str, List[Device]],
 ) -> None:
     """Set sensor parameters (occupancy time, sensitivity, coverage, etc.)."""
-    interval = 5  # seconds
+    timeout = 5.0  # seconds
 
     _LOGGER.info("=== Testing Sensor Parameter Configuration ===")
 
     # Find a sensor device to test
-    sensor_device = next(
-        (d for d in discovered_devices if is_sensor_device(d.dev_type)), None
-    )
+    sensor_device = next(iter(devices_by_type_prefix.get("02", ())), None)
 
     if not sensor_device:
         _LOGGER.warning("No sensor device found - skipping sensor parameter test")
@@ -370,21 +388,27 @@ async def test_set_sensor_param(
     )
 
     sensor_param_events: List[Tuple[str, SensorParamType]] = []
+    sensor_param_arrived = asyncio.Event()
 
     # Register callback for sensor parameter updates
     unsub = sensor_device.register_listener(
         CallbackEventType.SENSOR_PARAM,
-        _make_sensor_param_callback(sensor_param_events, sensor_device.dev_id),
+        _make_sensor_param_callback(
+            sensor_param_events, sensor_device.dev_id, sensor_param_arrived
+        ),
     )
 
+    async def read_back() -> bool:
+        baseline_events = len(sensor_param_events)
+        sensor_device.get_sensor_parameters()
+        return await _await_param_event(
+            sensor_param_events, baseline_events, sensor_param_arrived, timeout
+        )
+
     try:
         # Test 1: Get current sensor parameters
         _LOGGER.info("--- Test 1: Get current sensor parameters ---")
-        sensor_device.get_sensor_parameters()
-
-        await asyncio.sleep(interval)
-
-        if sensor_param_events:
+        if await read_back():
             _LOGGER.info("Received parameters: %s", sensor_param_events[-1][1])
         else:
             _LOGGER.warning("No sensor parameters received")
@@ -398,7 +422,8 @@ async def test_set_sensor_param(
         _LOGGER.info("Setting parameters: %s", params)
         sensor_device.set_sensor_parameters(params)
 
-        await asyncio.sleep(interval)
+        # setSensorArgv is not echoed as an event, so read back to confirm
+        await read_back()
         _LOGGER.info("Sensitivity and coverage parameters sent")
 
         # Test 3: Set sensor timing parameters
@@ -411,17 +436,14 @@ async def test_set_sensor_param(
         _LOGGER.info("Setting parameters: %s", params)
         sensor_device.set_sensor_parameters(params)
 
-        await asyncio.sleep(interval)
+        await read_back()
         _LOGGER.info("Timing parameters sent")
 
         # Test 4: Verify updated parameters
         _LOGGER.info("--- Test 4: Verify updated sensor parameters ---")
         sensor_param_events.clear()
-        sensor_device.get_sensor_parameters()
-
-        await asyncio.sleep(interval)
 
-        assert sensor_param_events, (
+        assert await read_back(), (
             "Could not verify updated sensor parameters - no response received"
         )
 
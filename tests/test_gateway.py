@@ -1,6 +1,7 @@
 """Tests for DALI gateway version, status sync, and restart."""
 
 import asyncio
+import contextlib
 import logging
 from typing import List, Tuple
 
@@ -20,6 +21,10 @@ async def test_version(connected_gateway: TestDaliGateway) -> None:
     _LOGGER.info("=== Testing Version Information ===")
     _LOGGER.info("(Version is automatically retrieved during gateway connection)")
 
+    # The response may still be in flight right after connect
+    if not await connected_gateway.wait_for_version(timeout=3.0):
+        _LOGGER.warning("No getVersion response received within 3s")
+
     sw = connected_gateway.software_version
     fw = connected_gateway.firmware_version
 
@@ -45,10 +50,12 @@ async def test_gateway_status_sync(connected_gateway: TestDaliGateway) -> None:
 
     gateway_sn = connected_gateway.gw_sn
     online_status_events: List[Tuple[str, bool]] = []
+    status_changed = asyncio.Event()
 
     def on_online_status(status: bool) -> None:
         """Capture online-status events."""
         online_status_events.append((gateway_sn, status))
+        status_changed.set()
         _LOGGER.info(
             "Gateway status changed: %s -> %s",
             gateway_sn,
@@ -84,8 +91,10 @@ async def test_gateway_status_sync(connected_gateway: TestDaliGateway) -> None:
 
     # -- Disconnect: expect offline callback --------------------------------
     online_status_events.clear()
+    status_changed.clear()
     await gateway.disconnect()
-    await asyncio.sleep(1)
+    with contextlib.suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(status_changed.wait(), timeout=2.0)
 
     gw_events = [e for e in online_status_events if e[0] == gateway_sn]
     assert gw_events, "No gateway status events received on disconnect"
@@ -114,8 +123,10 @@ async def test_gateway_status_sync(connected_gateway: TestDaliGateway) -> None:
         dev_id=new_gateway.gw_sn,
     )
 
+    status_changed.clear()
     await new_gateway.connect()
-    await asyncio.sleep(1)
+    with contextlib.suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(status_changed.wait(), timeout=2.0)
 
     gw_events = [e for e in online_status_events if e[0] == gateway_sn]
     assert len(gw_events) >= 2, (
@@ -53,13 +53,14 @@ async def test_group_discovery(
     assert isinstance(discovered_groups, list)
     _LOGGER.info("Found %d group(s)", len(discovered_groups))
 
-    for group in discovered_groups:
+    if discovered_groups and _LOGGER.isEnabledFor(logging.INFO):
         _LOGGER.info(
-            "  Group '%s' (ID: %s, Channel: %s): %d device(s)",
-            group.name,
-            group.group_id,
-            group.channel,
-            len(group.devices),
+            "Groups:\n%s",
+            "\n".join(
+                f"  Group '{group.name}' (ID: {group.group_id}, "
+                f"Channel: {group.channel}): {len(group.devices)} device(s)"
+                for group in discovered_groups
+            ),
         )
 
 
@@ -72,43 +73,50 @@ async def test_read_group(
 
     _LOGGER.info("=== Testing Read Group Commands ===")
 
-    for group in ensured_groups[:3]:
-        group_id = group.group_id
-        channel = group.channel
+    groups = ensured_groups[:3]
+    for group in groups:
         _LOGGER.info(
             "Reading group: %s (ID: %s, Channel: %s)",
             group.name,
-            group_id,
-            channel,
+            group.group_id,
+            group.channel,
         )
 
-        group_details = await connected_gateway.read_group(group_id, channel)
+    # Each read waits on its own (group_id, channel) event, so issue them together
+    results = await asyncio.gather(
+        *(
+            connected_gateway.read_group(group.group_id, group.channel)
+            for group in groups
+        ),
+        return_exceptions=True,
+    )
+
+    for group, group_details in zip(groups, results):
+        if isinstance(group_details, BaseException):
+            raise group_details
 
         assert "name" in group_details
         assert "devices" in group_details
         assert isinstance(group_details["devices"], list)
 
         _LOGGER.info(
-            "Group details - Name: '%s', Devices: %d",
+            "Group %s details - Name: '%s', Devices: %d",
+            group.group_id,
             group_details["name"],
             len(group_details["devices"]),
         )
 
-        for i, device in enumerate(group_details["devices"][:5], 1):
-            _LOGGER.info(
-                "  Device %d: %s (Type: %s, Channel: %s, Address: %s)",
-                i,
-                device.get("name", "Unknown"),
-                device["dev_type"],
-                device["channel"],
-                device["address"],
-            )
-
-        if len(group_details["devices"]) > 5:
-            _LOGGER.info(
-                "  ... and %d more devices",
-                len(group_details["devices"]) - 5,
-            )
+        group_devices = group_details["devices"]
+        if group_devices and _LOGGER.isEnabledFor(logging.INFO):
+            lines = [
+                f"  Device {i}: {device.get('name', 'Unknown')} "
+                f"(Type: {device['dev_type']}, Channel: {device['channel']}, "
+                f"Address: {device['address']})"
+                for i, device in enumerate(group_devices[:5], 1)
+            ]
+            if len(group_devices) > 5:
+                lines.append(f"  ... and {len(group_devices) - 5} more devices")
+            _LOGGER.info("Group %s devices:\n%s", group.group_id, "\n".join(lines))
 
     _LOGGER.info("Read group commands completed successfully")
 
@@ -0,0 +1,50 @@
+"""Tests for outbound request batching (no gateway connection required)."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from PySrDaliGateway.const import INBOUND_CALLBACK_BATCH_WINDOW_MS
+from PySrDaliGateway.gateway import DaliGateway
+
+pytestmark = pytest.mark.asyncio
+
+
+def _prop(dpid: int, value: Any) -> Dict[str, Any]:
+    return {"dpid": dpid, "dataType": "uint16", "value": value}
+
+
+async def test_write_press_write_keeps_call_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A state write queued after a press must be sent after it, not merged before."""
+    gateway = DaliGateway(
+        "GWTEST", "127.0.0.1", 1883, "user", "pass", loop=asyncio.get_running_loop()
+    )
+    sent: List[Dict[str, Any]] = []
+    monkeypatch.setattr(gateway, "_publish", sent.append)
+
+    gateway.add_request(
+        "writeDev", "0302", 0, 5, {"name": "write_a", "property": [_prop(22, 100)]}
+    )
+    gateway.add_request(
+        "writeDev",
+        "0302",
+        0,
+        5,
+        {"name": "press", "property": [_prop(1, 1)]},
+        coalesce=False,
+    )
+    gateway.add_request(
+        "writeDev", "0302", 0, 5, {"name": "write_b", "property": [_prop(22, 200)]}
+    )
+
+    await asyncio.sleep(INBOUND_CALLBACK_BATCH_WINDOW_MS / 1000.0 * 2)
+
+    assert len(sent) == 1
+    assert [entry["name"] for entry in sent[0]["data"]] == [
+        "write_a",
+        "press",
+        "write_b",
+    ]
@@ -4,12 +4,43 @@ import logging
 from typing import List
 
 from PySrDaliGateway.scene import Scene
+from PySrDaliGateway.types import SceneDeviceType
 
 from .helpers import TestDaliGateway
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _log_scene_device(index: int, device: SceneDeviceType) -> None:
+    """Log a scene device and its stored light state as two records."""
+    if not _LOGGER.isEnabledFor(logging.INFO):
+        return
+
+    _LOGGER.info(
+        "  Device %d: Type: %s, Channel: %s, Address: %s",
+        index,
+        device["dev_type"],
+        device["channel"],
+        device["address"],
+    )
+    light_status = device["property"]
+    _LOGGER.info(
+        "    Light Status: on=%s brightness=%s color_temp=%sK hs=%s rgbw=%s "
+        "white_level=%s",
+        light_status.get("is_on"),
+        light_status.get("brightness"),
+        light_status.get("color_temp_kelvin"),
+        light_status.get("hs_color"),
+        light_status.get("rgbw_color"),
+        light_status.get("white_level"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -25,13 +56,14 @@ async def test_scene_discovery(
     assert isinstance(discovered_scenes, list)
     _LOGGER.info("Found %d scene(s)", len(discovered_scenes))
 
-    for scene in discovered_scenes:
+    if discovered_scenes and _LOGGER.isEnabledFor(logging.INFO):
         _LOGGER.info(
-            "  Scene '%s' (ID: %s, Channel: %s): %d device(s)",
-            scene.name,
-            scene.scene_id,
-            scene.channel,
-            len(scene.devices),
+            "Scenes:\n%s",
+            "\n".join(
+                f"  Scene '{scene.name}' (ID: {scene.scene_id}, "
+                f"Channel: {scene.channel}): {len(scene.devices)} device(s)"
+                for scene in discovered_scenes
+            ),
         )
 
 
@@ -61,34 +93,7 @@ async def test_read_scene(
             assert "address" in device
             assert "property" in device
 
-            _LOGGER.info(
-                "  Device %d: Type: %s, Channel: %s, Address: %s",
-                i,
-                device["dev_type"],
-                device["channel"],
-                device["address"],
-            )
-
-            light_status = device["property"]
-            _LOGGER.info("    Light Status:")
-            if light_status.get("is_on") is not None:
-                _LOGGER.info("      On/Off: %s", light_status["is_on"])
-            if light_status.get("brightness") is not None:
-                _LOGGER.info("      Brightness: %s", light_status["brightness"])
-            if light_status.get("color_temp_kelvin") is not None:
-                _LOGGER.info(
-                    "      Color Temp: %sK",
-                    light_status["color_temp_kelvin"],
-                )
-            if light_status.get("hs_color") is not None:
-                _LOGGER.info("      HS Color: %s", light_status["hs_color"])
-            if light_status.get("rgbw_color") is not None:
-                _LOGGER.info("      RGBW Color: %s", light_status["rgbw_color"])
-            if light_status.get("white_level") is not None:
-                _LOGGER.info(
-                    "      White Level: %s",
-                    light_status["white_level"],
-                )
+            _log_scene_device(i, device)
 
         if len(scene.devices) > 5:
             _LOGGER.info("  ... and %d more devices", len(scene.devices) - 5)
@@ -117,34 +122,7 @@ async def test_scene_devices(
         _LOGGER.info("Scene has %d device(s)", len(scene.devices))
 
         for i, device in enumerate(scene.devices[:5], 1):
-            _LOGGER.info(
-                "  Device %d: Type: %s, Channel: %s, Address: %s",
-                i,
-                device["dev_type"],
-                device["channel"],
-                device["address"],
-            )
-
-            light_status = device["property"]
-            _LOGGER.info("    Light Status:")
-            if light_status.get("is_on") is not None:
-                _LOGGER.info("      On/Off: %s", light_status["is_on"])
-            if light_status.get("brightness") is not None:
-                _LOGGER.info("      Brightness: %s", light_status["brightness"])
-            if light_status.get("color_temp_kelvin") is not None:
-                _LOGGER.info(
-                    "      Color Temp: %sK",
-                    light_status["color_temp_kelvin"],
-                )
-            if light_status.get("hs_color") is not None:
-                _LOGGER.info("      HS Color: %s", light_status["hs_color"])
-            if light_status.get("rgbw_color") is not None:
-                _LOGGER.info("      RGBW Color: %s", light_status["rgbw_color"])
-            if light_status.get("white_level") is not None:
-                _LOGGER.info(
-                    "      White Level: %s",
-                    light_status["white_level"],
-                )
+            _log_scene_device(i, device)
 
         if len(scene.devices) > 5:
             _LOGGER.info("  ... and %d more devices", len(scene.devices) - 5)